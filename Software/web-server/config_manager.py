@@ -561,7 +561,7 @@ class ConfigurationManager:
                 raise RuntimeError("No JSON settings found to generate config")
 
             # Save to generated location
-            generated_path = self.user_settings_path.parent / "generated_golf_sim_config.json"
+            generated_path = self.generated_config_path
             if not self._save_json(generated_path, config):
                 raise RuntimeError(f"Failed to save generated config to {generated_path}")
 
@@ -572,6 +572,34 @@ class ConfigurationManager:
             logger.error(f"Failed to generate golf_sim_config.json: {e}")
             raise RuntimeError(f"Config generation failed: {e}")
 
+    def get_generated_config_path(self) -> Path:
+        """Get the generated golf_sim_config.json, regenerating it only when stale
+
+        The existing file is reused as long as it is newer than configurations.json,
+        the calibration data and the user settings it was built from.
+
+        Returns:
+            Path to the generated configuration file
+
+        Raises:
+            RuntimeError: If generation fails
+        """
+        generated_path = self.generated_config_path
+        try:
+            generated_mtime = generated_path.stat().st_mtime_ns
+        except OSError:
+            return self.generate_golf_sim_config()
+
+        metadata_path = Path(__file__).with_name("configurations.json")
+        for source in (metadata_path, self.calibration_data_path, self.user_settings_path):
+            try:
+                if source.stat().st_mtime_ns >= generated_mtime:
+                    return self.generate_golf_sim_config()
+            except OSError:
+                continue
+
+        return generated_path
+
     def _set_nested_json(self, config: dict, key: str, value: Any):
         """Set value in nested JSON structure based on dot notation key
 
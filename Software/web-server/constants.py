@@ -10,6 +10,10 @@ STOMP_PORT = 61613
 DEFAULT_USERNAME = "admin"
 DEFAULT_PASSWORD = "admin"
 
+# IPCMessageType header values the web server never decodes: Camera2 image
+# requests (1), Camera2 images (2), test still requests (3) and pre-images (6)
+SKIPPED_IPC_MESSAGE_TYPES = frozenset({"1", "2", "3", "6"})
+
 HOME_DIR = Path.home()
 PITRAC_DIR = HOME_DIR / ".pitrac"
 IMAGES_DIR = HOME_DIR / "LM_Shares" / "Images"
@@ -17,3 +21,4 @@ CONFIG_FILE = PITRAC_DIR / "config" / "pitrac.yaml"
 
 HEARTBEAT_INTERVAL = 30  # seconds
 MAX_MESSAGE_SIZE = 1024 * 1024  # 1MB
+DRAIN_BATCH_SIZE = 64  # queued messages processed per event loop turn
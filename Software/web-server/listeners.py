@@ -1,13 +1,17 @@
 import asyncio
 import base64
 import logging
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import msgpack
 import stomp
 
+from constants import DRAIN_BATCH_SIZE, MAX_MESSAGE_SIZE, SKIPPED_IPC_MESSAGE_TYPES
 from managers import ConnectionManager, ShotDataStore
-from parsers import ShotDataParser
+from models import ShotData
+from parsers import STATUS_MESSAGE_STRINGS, ShotDataParser
 
 logger = logging.getLogger(__name__)
 
@@ -28,104 +32,272 @@ class ActiveMQListener(stomp.ConnectionListener):
         self.parser = parser
         self.message_count = 0
         self.error_count = 0
+        # When set, a status update followed by any later update in the same drain
+        # batch is not broadcast: every payload carries the full current state, so
+        # clients lose nothing but the intermediate status. Shots are always sent.
+        self.conflate_status = False
+        # (message number, decoded data) waiting for the event loop. A single drain
+        # coroutine works through them in arrival order, so a burst costs one loop
+        # wakeup. The number travels with the data because message_count keeps
+        # moving on the receiver thread while the loop catches up.
+        self._pending: Deque[Tuple[int, Union[ShotData, Dict[str, Any]]]] = deque()
+        self._pending_lock = Lock()
+        self._drain_scheduled = False
+        self._drain_task: Optional[asyncio.Task] = None
+        # Bodies above this are skipped before extraction
+        self._max_payload_bytes = MAX_MESSAGE_SIZE
+        # Set on the event loop when the broker connection drops, so the
+        # reconnect monitor can wake immediately instead of polling
+        self.disconnected_event = asyncio.Event()
 
     def on_error(self, frame: Any) -> None:
         self.error_count += 1
-        logger.error(f"ActiveMQ error #{self.error_count}: {frame.body}")
+        logger.error("ActiveMQ error #%d: %s", self.error_count, frame.body)
 
     def on_message(self, frame: Any) -> None:
         self.message_count += 1
-        logger.info(f"Received ActiveMQ message #{self.message_count}")
+        # Per-message log calls use %-style arguments so the text is only built
+        # when a handler actually emits the record
+        logger.info("Received ActiveMQ message #%d", self.message_count)
+
+        # Image traffic shares the topic; drop it on the header alone, before
+        # touching a potentially multi-megabyte body
+        headers = getattr(frame, "headers", None) or {}
+        if headers:
+            # stomp.py hands headers over already decoded to str, so the type is
+            # classified with one dict lookup and one frozenset probe
+            ipc_message_type = headers.get("IPCMessageType")
+            if ipc_message_type in SKIPPED_IPC_MESSAGE_TYPES:
+                logger.debug("Skipping IPC message type %s (#%d)", ipc_message_type, self.message_count)
+                return
+
+        # Skip anything past the size limit before extracting (and possibly
+        # base64-decoding) the body. A bytes body
+        # (auto_decode=False, the normal case) is its own exact size, so the
+        # content-length header is only parsed for str bodies, whose character
+        # count understates the bytes on the wire.
+        body = getattr(frame, "body", None)
+        content_length = None
+        if type(body) is bytes:
+            size: Optional[int] = len(body)
+        else:
+            if headers:
+                content_length = self._content_length(headers)
+            size = content_length
+            if size is None and isinstance(body, str):
+                size = len(body)
+        if size is not None and size > self._max_payload_bytes:
+            logger.info("Skipping oversized message #%d (%d bytes)", self.message_count, size)
+            return
 
         try:
-            msgpack_data = self._extract_message_data(frame)
-            logger.debug(f"Extracted msgpack data: {len(msgpack_data)} bytes")
+            msgpack_data = self._extract_message_data(frame, headers, content_length)
+            logger.debug("Extracted msgpack data: %d bytes", len(msgpack_data))
 
             # Validate msgpack data before unpacking
             if len(msgpack_data) == 0:
-                logger.warning(f"Empty msgpack data for message #{self.message_count}")
+                logger.warning("Empty msgpack data for message #%d", self.message_count)
                 return
 
             data = msgpack.unpackb(msgpack_data, raw=False, strict_map_key=False)
-            logger.debug(
-                f"Unpacked message data keys: {list(data) if isinstance(data, dict) else len(data) if isinstance(data, list) else type(data)}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Unpacked message data keys: %s",
+                    list(data) if isinstance(data, dict) else len(data) if isinstance(data, list) else type(data),
+                )
 
-            if self.loop:
-                asyncio.run_coroutine_threadsafe(self._process_and_broadcast(data), self.loop)
+            loop = self.loop
+            if loop:
+                # msgpack only ever produces exact list/dict types, so a type() identity
+                # check selects the path without an isinstance MRO walk
+                if type(data) is list:
+                    # Array messages carry a complete shot and need no shared state, so
+                    # parse them here and leave only store-and-broadcast to the event loop
+                    data = self.parser.parse_array_format(data)
+                elif type(data) is not dict:
+                    raise ValueError(f"Unsupported message payload type: {type(data).__name__}")
+                self._enqueue(loop, self.message_count, data)
             else:
                 logger.error("Event loop not set in listener")
 
         except msgpack.exceptions.ExtraData:
             # This is likely a large binary image message - log but don't error
-            logger.info(f"Large binary message #{self.message_count} - Extra data in msgpack, skipping")
+            logger.info("Large binary message #%d - Extra data in msgpack, skipping", self.message_count)
         except msgpack.exceptions.UnpackException as e:
-            logger.error(f"Failed to unpack message #{self.message_count}: {e}")
+            logger.error("Failed to unpack message #%d: %s", self.message_count, e)
+        except ValueError as e:
+            logger.error("Invalid data format in message #%d: %s", self.message_count, e)
         except Exception as e:
-            logger.error(f"Error processing message #{self.message_count}: {e}", exc_info=True)
+            logger.error("Error processing message #%d: %s", self.message_count, e, exc_info=True)
 
-    def _extract_message_data(self, frame: Any) -> bytes:
+    @staticmethod
+    def _content_length(headers: Dict[str, Any]) -> Optional[int]:
+        try:
+            return int(headers["content-length"])
+        except (KeyError, ValueError, TypeError):
+            return None
+
+    @property
+    def max_payload_bytes(self) -> int:
+        return self._max_payload_bytes
+
+    @max_payload_bytes.setter
+    def max_payload_bytes(self, value: int) -> None:
+        if value <= 0:
+            raise ValueError(f"max_payload_bytes must be positive, got {value}")
+        self._max_payload_bytes = value
+
+    def _enqueue(
+        self, loop: asyncio.AbstractEventLoop, message_number: int, data: Union[ShotData, Dict[str, Any]]
+    ) -> None:
+        """Queue decoded data and schedule the drain unless one is already pending"""
+        with self._pending_lock:
+            self._pending.append((message_number, data))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+
+        try:
+            # A plain callback handoff: unlike run_coroutine_threadsafe this does not
+            # allocate a concurrent Future that nobody ever waits on
+            loop.call_soon_threadsafe(self._start_drain)
+        except Exception:
+            # Loop is gone (e.g. shutting down) - nothing will drain what is queued
+            with self._pending_lock:
+                self._pending.clear()
+                self._drain_scheduled = False
+            raise
+
+    def _take_batch(self) -> Optional[List[Tuple[int, Union[ShotData, Dict[str, Any]]]]]:
+        """Pop up to DRAIN_BATCH_SIZE queued messages, or end the drain if none are left"""
+        pending = self._pending
+        with self._pending_lock:
+            if not pending:
+                self._drain_scheduled = False
+                return None
+            if len(pending) <= DRAIN_BATCH_SIZE:
+                batch = list(pending)
+                pending.clear()
+            else:
+                popleft = pending.popleft
+                batch = [popleft() for _ in range(DRAIN_BATCH_SIZE)]
+        return batch
+
+    def _start_drain(self) -> None:
+        """Runs on the event loop thread; keeps a reference so the task is not collected"""
+        if not self.connection_manager.connection_count:
+            # Nobody to broadcast to means nothing to await, so update the store
+            # from this callback instead of creating a task for the burst
+            batch = self._take_batch()
+            if batch is None:
+                return
+            process = self._process
+            for message_number, data in batch:
+                process(data, message_number)
+            with self._pending_lock:
+                if not self._pending:
+                    self._drain_scheduled = False
+                    return
+            # Anything past one batch continues in a task so the loop gets a turn
+
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain_pending())
+
+    async def _drain_pending(self) -> None:
+        """Process queued messages in order, at most DRAIN_BATCH_SIZE per loop turn"""
+        # Bound once per drain rather than looked up for every message in a burst
+        pending = self._pending
+        take_batch = self._take_batch
+        process = self._process
+        broadcast_many = self.connection_manager.broadcast_many
+        conflate_status = self.conflate_status
+        while True:
+            batch = take_batch()
+            if batch is None:
+                return
+
+            payloads: List[Dict[str, Any]] = []
+            append = payloads.append
+            for message_number, data in batch:
+                payload = process(data, message_number)
+                if payload is not None:
+                    append(payload)
+
+            if conflate_status and len(payloads) > 1:
+                payloads = self._conflate_statuses(payloads)
+
+            try:
+                await broadcast_many(payloads)
+            except Exception as e:
+                logger.error("Error broadcasting %d updates: %s", len(payloads), e, exc_info=True)
+
+            # A long burst would otherwise hold the loop until it is fully drained;
+            # let websocket handlers and other tasks run between batches
+            if pending:
+                await asyncio.sleep(0)
+
+    @staticmethod
+    def _conflate_statuses(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop status payloads superseded by a later payload in the same batch"""
+        last = len(payloads) - 1
+        return [
+            payload
+            for index, payload in enumerate(payloads)
+            if index == last or payload["result_type"] not in STATUS_MESSAGE_STRINGS
+        ]
+
+    def _extract_message_data(self, frame: Any, headers: Dict[str, Any], content_length: Optional[int]) -> bytes:
+        """Return the frame body as msgpack bytes.
+
+        headers and content_length are read once by on_message and passed in.
+        """
         if not hasattr(frame, "body"):
             raise ValueError("Frame has no body attribute")
 
         body = frame.body
-        logger.debug(f"Frame body type: {type(body)}, length: {len(body) if hasattr(body, '__len__') else 'unknown'}")
-        logger.debug(f"Frame headers: {getattr(frame, 'headers', {})}")
+        is_base64 = headers.get("encoding") == "base64"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Frame body type: %s, length: %s", type(body), len(body) if hasattr(body, "__len__") else "unknown"
+            )
+            logger.debug("Frame headers: %s", headers)
 
         # Handle different body types from STOMP protocol
         if isinstance(body, bytes):
-            # Already bytes, use directly
+            # Already bytes (the server connects with auto_decode=False), use directly
             logger.debug("Body is already bytes")
+            if is_base64:
+                try:
+                    body = base64.b64decode(body)
+                except Exception as e:
+                    logger.warning("Failed to decode base64 bytes: %s", e)
         elif isinstance(body, str):
             # String body - need to handle encoding carefully
-            logger.debug(f"Body is string, length: {len(body)}")
+            logger.debug("Body is string, length: %d", len(body))
 
             # Check for base64 encoding header first
-            if hasattr(frame, "headers") and frame.headers.get("encoding") == "base64":
+            if is_base64:
                 logger.debug("Message has base64 encoding header")
                 try:
                     # Direct base64 decode from string
                     body = base64.b64decode(body)
-                    logger.debug(f"Successfully decoded base64 to {len(body)} bytes")
+                    logger.debug("Successfully decoded base64 to %d bytes", len(body))
                 except Exception as e:
-                    logger.warning(f"Failed to decode base64 string: {e}")
+                    logger.warning("Failed to decode base64 string: %s", e)
                     # Fall back to UTF-8 encoding
                     body = body.encode("utf-8")
             else:
                 # Check if this looks like binary data based on content-length vs string length
-                content_length = None
-                if hasattr(frame, "headers") and "content-length" in frame.headers:
-                    try:
-                        content_length = int(frame.headers["content-length"])
-                    except (ValueError, TypeError):
-                        pass
-
-                # Check for large binary image messages (Camera2 images)
-                ipc_message_type = frame.headers.get("IPCMessageType") if hasattr(frame, "headers") else None
-                if content_length and content_length > len(body) * 1.5 and ipc_message_type == "2":
-                    logger.info(f"Received Camera2 image message ({content_length} bytes)")
-                    # This is a Camera2 image - handle it specially
-                    try:
-                        body = body.encode("latin-1")
-                        logger.debug("Encoded Camera2 image as latin-1")
-                        # Mark this as an image message for special processing
-                        # self._handle_image_message(body, content_length)
-                        return b""
-                    except UnicodeEncodeError as e:
-                        logger.warning(f"Failed to encode Camera2 image as latin-1: {e}")
-                        logger.info("Skipping corrupted Camera2 image")
-                        return b""
-                elif content_length and content_length > len(body) * 1.5:
+                if content_length and content_length > len(body) * 1.5:
                     logger.info(
-                        f"Detected large binary data (content-length={content_length}, string_length={len(body)})"
+                        "Detected large binary data (content-length=%d, string_length=%d)", content_length, len(body)
                     )
                     # Other binary data
                     try:
                         body = body.encode("latin-1")
                         logger.debug("Encoded binary string as latin-1")
                     except UnicodeEncodeError as e:
-                        logger.warning(f"Failed to encode binary data as latin-1: {e}")
-                        logger.info(f"Skipping corrupted binary message #{self.message_count}")
+                        logger.warning("Failed to encode binary data as latin-1: %s", e)
+                        logger.info("Skipping corrupted binary message #%d", self.message_count)
                         return b""
                 else:
                     # Regular text string - encode as UTF-8
@@ -133,17 +305,17 @@ class ActiveMQListener(stomp.ConnectionListener):
                         body = body.encode("utf-8")
                         logger.debug("Encoded string as UTF-8")
                     except UnicodeEncodeError as e:
-                        logger.error(f"Failed to encode string as UTF-8: {e}")
+                        logger.error("Failed to encode string as UTF-8: %s", e)
                         # Try latin-1 as fallback, but handle errors
                         try:
                             body = body.encode("latin-1", errors="replace")
                             logger.warning("Fell back to latin-1 encoding with replacement")
                         except Exception as e2:
-                            logger.error(f"Failed to encode with latin-1 fallback: {e2}")
+                            logger.error("Failed to encode with latin-1 fallback: %s", e2)
                             raise ValueError(f"Cannot encode string body: {e}")
         else:
             # Unknown type, try to convert
-            logger.debug(f"Unexpected body type: {type(body)}")
+            logger.debug("Unexpected body type: %s", type(body))
             try:
                 if hasattr(body, "__iter__") and not isinstance(body, (str, bytes)):
                     # Iterable but not string/bytes - convert to bytes
@@ -151,65 +323,66 @@ class ActiveMQListener(stomp.ConnectionListener):
                 else:
                     # Try string conversion then UTF-8 encoding
                     body = str(body).encode("utf-8")
-                logger.debug(f"Converted {type(frame.body)} to bytes")
+                logger.debug("Converted %s to bytes", type(frame.body))
             except Exception as e:
-                logger.error(f"Cannot convert frame.body to bytes: {type(body)}, {e}")
+                logger.error("Cannot convert frame.body to bytes: %s, %s", type(body), e)
                 raise ValueError(f"Unsupported body type: {type(body)}")
 
         return body
 
-    async def _process_and_broadcast(self, data: Union[List[Any], Dict[str, Any]]) -> None:
+    def _process(
+        self, data: Union[ShotData, List[Any], Dict[str, Any]], message_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Parse data, update the shot store, and return the payload to broadcast (None on error)"""
         try:
-            if isinstance(data, list):
-                parsed_data = self.parser.parse_array_format(data)
-            else:
+            # Most common first: arrays arrive pre-parsed from the receiver thread
+            parsed_data: ShotData
+            if type(data) is ShotData:
+                parsed_data = data
+            elif type(data) is dict:
                 current = self.shot_store.get()
                 parsed_data = self.parser.parse_dict_format(data, current)
+            elif type(data) is list:
+                parsed_data = self.parser.parse_array_format(data)
+            else:
+                raise ValueError(f"Unsupported message payload type: {type(data).__name__}")
 
-            if not self.parser.validate_shot_data(parsed_data):
-                logger.warning("Data validation failed, but continuing...")
-
-            # Check if this is a status message (preserve existing shot data)
-            is_status_message = parsed_data.result_type in ShotDataParser._get_status_message_strings()
-
-            if is_status_message:
+            # Status messages carry no shot values, and validate_shot_data would only
+            # repeat this membership test and pass them, so validate shots alone
+            if parsed_data.result_type in STATUS_MESSAGE_STRINGS:
                 # For status messages, update only the status and message, preserve shot data
-                current = self.shot_store.get()
-                status_update = current.to_dict()
-                status_update.update(
-                    {
-                        "result_type": parsed_data.result_type,
-                        "message": parsed_data.message,
-                        "timestamp": parsed_data.timestamp,
-                    }
+                updated_data = self.shot_store.update_status(
+                    parsed_data.result_type, parsed_data.message, parsed_data.timestamp
                 )
-                from models import ShotData
-
-                updated_data = ShotData.from_dict(status_update)
-                self.shot_store.update(updated_data)
-                await self.connection_manager.broadcast(updated_data.to_dict())
 
                 logger.info(
-                    f"Processed status #{self.message_count}: "
-                    f"type={parsed_data.result_type}, "
-                    f"message='{parsed_data.message}'"
+                    "Processed status #%d: type=%s, message='%s'",
+                    message_number,
+                    parsed_data.result_type,
+                    parsed_data.message,
                 )
-            else:
-                # This is actual shot data - update everything
-                self.shot_store.update(parsed_data)
-                await self.connection_manager.broadcast(parsed_data.to_dict())
+                return updated_data.to_dict()
 
-                logger.info(
-                    f"Processed shot #{self.message_count}: "
-                    f"speed={parsed_data.speed} mph, "
-                    f"launch={parsed_data.launch_angle}°, "
-                    f"side={parsed_data.side_angle}°"
-                )
+            if not self.parser.validate_shot_data(parsed_data):
+                logger.warning("Data validation failed, but continuing...")
+
+            # This is actual shot data - update everything
+            self.shot_store.update(parsed_data)
+
+            logger.info(
+                "Processed shot #%d: speed=%s mph, launch=%s°, side=%s°",
+                message_number,
+                parsed_data.speed,
+                parsed_data.launch_angle,
+                parsed_data.side_angle,
+            )
+            return parsed_data.to_dict()
 
         except ValueError as e:
-            logger.error(f"Invalid data format: {e}")
+            logger.error("Invalid data format: %s", e)
         except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+            logger.error("Error processing message: %s", e, exc_info=True)
+        return None
 
     def on_connected(self, frame: Any) -> None:
         logger.info("Connected to ActiveMQ")
@@ -218,8 +391,9 @@ class ActiveMQListener(stomp.ConnectionListener):
         self.error_count = 0
 
     def on_disconnected(self) -> None:
-        logger.warning(f"Disconnected from ActiveMQ (processed {self.message_count} messages)")
+        logger.warning("Disconnected from ActiveMQ (processed %d messages)", self.message_count)
         self.connected = False
+        self._signal_disconnected()
 
     def on_heartbeat(self) -> None:
         """Called when a heartbeat is received from the broker"""
@@ -229,6 +403,16 @@ class ActiveMQListener(stomp.ConnectionListener):
         """Called when heartbeat timeout occurs"""
         logger.warning("ActiveMQ heartbeat timeout detected")
         self.connected = False
+        self._signal_disconnected()
+
+    def _signal_disconnected(self) -> None:
+        if not self.loop:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.disconnected_event.set)
+        except RuntimeError:
+            # Event loop already closed during shutdown
+            pass
 
     def get_stats(self) -> Dict[str, Any]:
         return {
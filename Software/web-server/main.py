@@ -2,12 +2,24 @@
 """
 PiTrac Web Server - Lightweight replacement for TomEE
 Serves dashboard, handles ActiveMQ messages, and manages shot images
+
+Runs on uvloop when it is installed (uvicorn[standard] pulls it in). The
+subprocess launches and pipe reads in PiTracProcessManager and
+TestingToolsManager go through libuv there, falling back to the stdlib
+asyncio loop otherwise.
 """
 
 import logging
 import os
 import uvicorn
 
+try:
+    import uvloop  # noqa: F401
+
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 LOG_LEVEL = os.getenv("PITRAC_WEB_LOG_LEVEL", "INFO").upper()
 if LOG_LEVEL not in ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
     LOG_LEVEL = "INFO"
@@ -29,4 +41,4 @@ if __name__ == "__main__":
     elif uvicorn_level == "critical":
         uvicorn_level = "error"
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8080, reload=True, log_level=uvicorn_level)
+    uvicorn.run("main:app", host="0.0.0.0", port=8080, reload=True, log_level=uvicorn_level, loop=EVENT_LOOP)
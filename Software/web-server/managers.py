@@ -1,16 +1,41 @@
+import asyncio
+import json
 import logging
 from threading import Lock
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from fastapi import WebSocket
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 from models import ShotData
 
+
+def _json_dumps(payload: Dict[str, Any]) -> str:
+    # Same encoding WebSocket.send_json uses
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    if not _HAS_ORJSON:
+        return _json_dumps(payload)
+    try:
+        return orjson.dumps(payload).decode()
+    except TypeError:
+        # orjson rejects ints wider than 64 bits and non-str keys, which json accepts
+        return _json_dumps(payload)
+
+
 logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self) -> None:
         self._connections: Set[WebSocket] = set()
         self._lock = Lock()
 
@@ -35,19 +60,58 @@ class ConnectionManager:
             return False
 
     async def broadcast(self, data: Dict[str, Any]) -> None:
+        # Serialized once and sent as text, rather than send_json re-encoding the
+        # same dict for every client
+        await self.broadcast_many([data])
+
+    async def broadcast_many(self, payloads: List[Dict[str, Any]]) -> None:
+        """Send several updates to every client, serializing each payload only once.
+
+        Clients still receive one message per payload, in order, exactly as if
+        broadcast() had been called for each.
+        """
+        if not payloads:
+            return
+
         with self._lock:
             connections = list(self._connections)
+        if not connections:
+            return
 
-        disconnected = []
-        for websocket in connections:
+        # orjson when installed; both produce compact JSON text frames. A payload
+        # that cannot be encoded is dropped rather than failing the whole batch.
+        texts = []
+        for payload in payloads:
             try:
-                await websocket.send_json(data)
-            except Exception as e:
-                logger.warning(f"Failed to send to websocket: {e}")
-                disconnected.append(websocket)
-
-        for websocket in disconnected:
-            self.disconnect(websocket)
+                texts.append(_dumps(payload))
+            except (TypeError, ValueError) as e:
+                logger.error("Dropping update that cannot be encoded as JSON: %s", e)
+        if not texts:
+            return
+
+        if len(connections) == 1:
+            results: List[Any] = [await self._send_texts(connections[0], texts)]
+        else:
+            # Clients are written concurrently so one slow browser does not hold
+            # back the rest; each client still gets its messages in order
+            results = await asyncio.gather(
+                *(self._send_texts(websocket, texts) for websocket in connections), return_exceptions=True
+            )
+
+        for websocket, result in zip(connections, results):
+            if result is not None:
+                logger.warning(f"Failed to send to websocket: {result}")
+                self.disconnect(websocket)
+
+    @staticmethod
+    async def _send_texts(websocket: WebSocket, texts: List[str]) -> Optional[BaseException]:
+        """Send texts in order, returning the error instead of raising it"""
+        try:
+            for text in texts:
+                await websocket.send_text(text)
+        except Exception as e:
+            return e
+        return None
 
     @property
     def connection_count(self) -> int:
@@ -62,7 +126,7 @@ class ConnectionManager:
 
 
 class ShotDataStore:
-    def __init__(self):
+    def __init__(self) -> None:
         self._current_shot = ShotData()
         self._lock = Lock()
         self._history: List[ShotData] = []
@@ -73,6 +137,12 @@ class ShotDataStore:
             self._current_shot = shot_data
             self._add_to_history(shot_data)
 
+    def update_status(self, result_type: str, message: str, timestamp: Optional[str]) -> ShotData:
+        """Swap in a new status on the current shot under a single lock hold"""
+        with self._lock:
+            self._current_shot = self._current_shot.with_status(result_type, message, timestamp)
+            return self._current_shot
+
     def get(self) -> ShotData:
         with self._lock:
             return self._current_shot
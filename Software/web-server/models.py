@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -16,7 +16,9 @@ class ResultType(Enum):
     CALIBRATION = 9
 
 
-@dataclass
+# One of these is built for every ActiveMQ message and up to 100 are kept in the
+# shot history; slots keep each instance small and attribute access direct
+@dataclass(slots=True)
 class ShotData:
     speed: float = 0.0
     carry: float = 0.0
@@ -30,7 +32,24 @@ class ShotData:
     images: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built field by field: asdict() recursively deep-copies every value, when
+        # images is the only mutable field
+        return {
+            "speed": self.speed,
+            "carry": self.carry,
+            "launch_angle": self.launch_angle,
+            "side_angle": self.side_angle,
+            "back_spin": self.back_spin,
+            "side_spin": self.side_spin,
+            "result_type": self.result_type,
+            "message": self.message,
+            "timestamp": self.timestamp,
+            "images": list(self.images),
+        }
+
+    def with_status(self, result_type: str, message: str, timestamp: Optional[str]) -> "ShotData":
+        """Return a copy carrying a new status while keeping the shot values"""
+        return replace(self, result_type=result_type, message=message, timestamp=timestamp)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ShotData":
@@ -8,50 +8,74 @@ from models import ResultType, ShotData
 logger = logging.getLogger(__name__)
 
 
-class ShotDataParser:
+# Result type strings that represent status messages (not shot data)
+STATUS_MESSAGE_STRINGS = frozenset(
+    {
+        "Ball Placed",  # kBallPlacedAndReadyForHit - C++ actual string
+        "Ball Ready",  # Legacy support for old enum conversion
+        "Initializing",
+        "Waiting For Ball",
+        "Waiting For Simulator",
+        "Waiting For Placement To Stabilize",  # C++ actual string
+        "Pausing For Stabilization",  # Legacy support
+        "Multiple Balls Present",  # C++ actual string
+        "Multiple Balls",  # Legacy support
+        "Error",
+        "Calibration Results",  # C++ actual string
+        "Calibration",  # Legacy support
+        "Unknown",
+        "Control Message",
+    }
+)
+
+
+# Exact strings C++ FormatResultType sends, indexed by GsIPCResultType value
+RESULT_TYPE_STRINGS = (
+    "Unknown",  # 0
+    "Initializing",  # 1
+    "Waiting For Ball",  # 2
+    "Waiting For Simulator",  # 3
+    "Waiting For Placement To Stabilize",  # 4
+    "Multiple Balls Present",  # 5
+    "Ball Placed",  # 6
+    "Hit",  # 7
+    "Error",  # 8
+    "Calibration Results",  # 9
+    "Control Message",  # 10
+)
+
+# Array-format result type values that carry status rather than shot data
+STATUS_RESULT_TYPES = frozenset(
+    {
+        ResultType.BALL_READY.value,  # 6 - kBallPlacedAndReadyForHit
+        ResultType.INITIALIZING.value,  # 1
+        ResultType.WAITING_FOR_BALL.value,  # 2
+        ResultType.WAITING_FOR_SIMULATOR.value,  # 3
+        ResultType.PAUSING_FOR_STABILIZATION.value,  # 4
+        ResultType.MULTIPLE_BALLS.value,  # 5
+        ResultType.ERROR.value,  # 8
+        ResultType.CALIBRATION.value,  # 9
+        ResultType.UNKNOWN.value,  # 0
+    }
+)
+
+# Messages the C++ side sends with kHit (7) that are configuration, not shots
+FAKE_HIT_MESSAGES = frozenset({"Club type was set", "Test message", "Configuration update"})
 
-    @staticmethod
-    def _get_status_message_strings() -> List[str]:
-        """Get all strings that represent status messages (not shot data)"""
-        return [
-            "Ball Placed",  # kBallPlacedAndReadyForHit - C++ actual string
-            "Ball Ready",  # Legacy support for old enum conversion
-            "Initializing",
-            "Waiting For Ball",
-            "Waiting For Simulator",
-            "Waiting For Placement To Stabilize",  # C++ actual string
-            "Pausing For Stabilization",  # Legacy support
-            "Multiple Balls Present",  # C++ actual string
-            "Multiple Balls",  # Legacy support
-            "Error",
-            "Calibration Results",  # C++ actual string
-            "Calibration",  # Legacy support
-            "Unknown",
-            "Control Message",
-        ]
+
+class ShotDataParser:
 
     @staticmethod
     def _get_result_type_string(result_type: int) -> str:
         """Convert result type integer to the exact string that C++ FormatResultType sends"""
-        cpp_string_mapping = {
-            0: "Unknown",
-            1: "Initializing",
-            2: "Waiting For Ball",
-            3: "Waiting For Simulator",
-            4: "Waiting For Placement To Stabilize",
-            5: "Multiple Balls Present",
-            6: "Ball Placed",
-            7: "Hit",
-            8: "Error",
-            9: "Calibration Results",
-            10: "Control Message",
-        }
-
-        if result_type in cpp_string_mapping:
-            return cpp_string_mapping[result_type]
-        else:
-            result_type_enum = ResultType(result_type)
-            return result_type_enum.name.replace("_", " ").title()
+        try:
+            if 0 <= result_type < len(RESULT_TYPE_STRINGS):
+                return RESULT_TYPE_STRINGS[result_type]
+        except TypeError:
+            pass
+
+        result_type_enum = ResultType(result_type)
+        return result_type_enum.name.replace("_", " ").title()
 
     @staticmethod
     def parse_array_format(data: List[Any]) -> ShotData:
@@ -81,29 +105,9 @@ class ShotDataParser:
 
         # Special handling for result_type 7 which is overloaded in C++
         # Real hits vs configuration messages that misuse kHit type
-        is_fake_hit_message = result_type == 7 and message in [
-            "Club type was set",
-            "Test message",
-            "Configuration update",
-        ]
-
-        is_status_message = (
-            result_type
-            in [
-                ResultType.BALL_READY.value,  # 6 - kBallPlacedAndReadyForHit
-                ResultType.INITIALIZING.value,  # 1
-                ResultType.WAITING_FOR_BALL.value,  # 2
-                ResultType.WAITING_FOR_SIMULATOR.value,  # 3
-                ResultType.PAUSING_FOR_STABILIZATION.value,  # 4
-                ResultType.MULTIPLE_BALLS.value,  # 5
-                ResultType.ERROR.value,  # 8
-                ResultType.CALIBRATION.value,  # 9
-                ResultType.UNKNOWN.value,  # 0
-            ]
-            or is_fake_hit_message
-        )
+        is_fake_hit_message = result_type == 7 and message in FAKE_HIT_MESSAGES
 
-        if is_status_message:
+        if result_type in STATUS_RESULT_TYPES or is_fake_hit_message:
             return ShotData(
                 carry=0.0,  # Status messages don't contain shot data
                 speed=0.0,
@@ -116,62 +120,54 @@ class ShotDataParser:
                 timestamp=datetime.now().isoformat(),
                 images=[],
             )
-        else:
-            return ShotData(
-                carry=carry_meters,
-                speed=round(speed_mpers * MPS_TO_MPH, 1),
-                launch_angle=round(launch_angle_deg, 1),
-                side_angle=round(side_angle_deg, 1),
-                back_spin=int(back_spin_rpm),
-                side_spin=int(side_spin_rpm),
-                result_type=result_type_str,
-                message=message,
-                timestamp=datetime.now().isoformat(),
-                images=image_file_paths,
-            )
+
+        return ShotData(
+            carry=carry_meters,
+            speed=round(speed_mpers * MPS_TO_MPH, 1),
+            launch_angle=round(launch_angle_deg, 1),
+            side_angle=round(side_angle_deg, 1),
+            back_spin=int(back_spin_rpm),
+            side_spin=int(side_spin_rpm),
+            result_type=result_type_str,
+            message=message,
+            timestamp=datetime.now().isoformat(),
+            images=image_file_paths,
+        )
 
     @staticmethod
     def parse_dict_format(data: Dict[str, Any], current: ShotData) -> ShotData:
-        updates = {}
-
-        if "speed" in data:
-            updates["speed"] = round(float(data["speed"]), 1)
-        if "carry" in data:
-            updates["carry"] = round(float(data["carry"]), 1)
-        if "launch_angle" in data:
-            updates["launch_angle"] = round(float(data["launch_angle"]), 1)
-        if "side_angle" in data:
-            updates["side_angle"] = round(float(data["side_angle"]), 1)
-        if "back_spin" in data:
-            updates["back_spin"] = int(data["back_spin"])
-        if "side_spin" in data:
-            updates["side_spin"] = int(data["side_spin"])
-
+        result_type = current.result_type
         if "result_type" in data:
             try:
                 result_type_val = data["result_type"]
                 if isinstance(result_type_val, int):
-                    updates["result_type"] = ShotDataParser._get_result_type_string(result_type_val)
+                    result_type = ShotDataParser._get_result_type_string(result_type_val)
                 else:
-                    updates["result_type"] = str(result_type_val)
+                    result_type = str(result_type_val)
             except ValueError:
-                updates["result_type"] = f"Type {data['result_type']}"
+                result_type = f"Type {data['result_type']}"
                 logger.warning(f"Unknown result type: {data['result_type']}")
 
-        if "message" in data:
-            updates["message"] = str(data["message"])
-        if "image_paths" in data:
-            updates["images"] = list(data["image_paths"])
-
-        updates["timestamp"] = datetime.now().isoformat()
-
-        current_dict = current.to_dict()
-        current_dict.update(updates)
-        return ShotData(**current_dict)
+        # Every field is resolved in one constructor call: present keys are
+        # converted, absent ones carry over from current. This skips the
+        # intermediate updates dict and dataclasses.replace(), which walks the
+        # field list on each call and was the larger share of the parse.
+        return ShotData(
+            speed=round(float(data["speed"]), 1) if "speed" in data else current.speed,
+            carry=round(float(data["carry"]), 1) if "carry" in data else current.carry,
+            launch_angle=round(float(data["launch_angle"]), 1) if "launch_angle" in data else current.launch_angle,
+            side_angle=round(float(data["side_angle"]), 1) if "side_angle" in data else current.side_angle,
+            back_spin=int(data["back_spin"]) if "back_spin" in data else current.back_spin,
+            side_spin=int(data["side_spin"]) if "side_spin" in data else current.side_spin,
+            result_type=result_type,
+            message=str(data["message"]) if "message" in data else current.message,
+            timestamp=datetime.now().isoformat(),
+            images=list(data["image_paths"]) if "image_paths" in data else list(current.images),
+        )
 
     @staticmethod
     def validate_shot_data(shot_data: ShotData) -> bool:
-        if shot_data.result_type in ShotDataParser._get_status_message_strings():
+        if shot_data.result_type in STATUS_MESSAGE_STRINGS:
             logger.info(f"Validated status message: '{shot_data.result_type}' with message: '{shot_data.message}'")
             return True
 
@@ -43,6 +43,8 @@ class PiTracProcessManager:
         self.startup_delay_camera2 = proc_mgmt.get("startupDelayCamera2", {}).get("default", 2)
         self.startup_wait_camera2_ready = proc_mgmt.get("startupWaitCamera2Ready", {}).get("default", 1)
         self.startup_delay_camera1 = proc_mgmt.get("startupDelayCamera1", {}).get("default", 3)
+        self.startup_ready_marker = proc_mgmt.get("startupReadyMarker", {}).get("default", "")
+        self.startup_check_interval = proc_mgmt.get("startupCheckInterval", {}).get("default", 0.1)
         self.shutdown_grace_period = proc_mgmt.get("shutdownGracePeriod", {}).get("default", 5)
         self.shutdown_check_interval = proc_mgmt.get("shutdownCheckInterval", {}).get("default", 0.1)
         self.post_kill_delay = proc_mgmt.get("postKillDelay", {}).get("default", 0.5)
@@ -55,6 +57,17 @@ class PiTracProcessManager:
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         self.pid_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Child environment: parent environment snapshot plus the fixed PiTrac variables
+        home_dir = str(Path.home())
+        self._base_env = dict(os.environ)
+        self._pitrac_env = {
+            "LD_LIBRARY_PATH": "/usr/lib/pitrac",
+            "PITRAC_ROOT": "/usr/lib/pitrac",
+            "PITRAC_BASE_IMAGE_LOGGING_DIR": "~/LM_Shares/Images/".replace("~", home_dir),
+            "PITRAC_WEBSERVER_SHARE_DIR": "~/LM_Shares/WebShare/".replace("~", home_dir),
+            "PITRAC_MSG_BROKER_FULL_ADDRESS": "tcp://localhost:61616",
+        }
+
     def _get_system_mode(self) -> str:
         """Get the system mode (single or dual Pi)"""
         config = self.config_manager.get_config()
@@ -120,7 +133,15 @@ class PiTracProcessManager:
         This method uses the passedVia and passedTo metadata to automatically
         set environment variables instead of manual hardcoding.
         """
-        env = os.environ.copy()
+        return self._base_env | self._get_metadata_environment(camera)
+
+    def _get_metadata_environment(self, camera: str = "camera1") -> dict:
+        """Get only the environment variables defined by configurations.json metadata
+
+        Args:
+            camera: Which camera the variables are passed to ("camera1" or "camera2")
+        """
+        env = {}
         merged_config = self.config_manager.get_config()
 
         target = camera  # "camera1" or "camera2"
@@ -209,29 +230,19 @@ class PiTracProcessManager:
             system_mode = self._get_system_mode()
             is_single_pi = system_mode == "single"
 
-            # Set up environment variables
-            env = os.environ.copy()
-            home_dir = str(Path.home())
-
-            # Set standard environment variables
-            env["LD_LIBRARY_PATH"] = "/usr/lib/pitrac"
-            env["PITRAC_ROOT"] = "/usr/lib/pitrac"
-            env["PITRAC_BASE_IMAGE_LOGGING_DIR"] = "~/LM_Shares/Images/".replace("~", home_dir)
-            env["PITRAC_WEBSERVER_SHARE_DIR"] = "~/LM_Shares/WebShare/".replace("~", home_dir)
-            env["PITRAC_MSG_BROKER_FULL_ADDRESS"] = "tcp://localhost:61616"
-
-            # Set camera-specific environment variables
+            # Set camera-specific environment variables on top of the standard ones
             if is_single_pi:
                 # Single Pi mode: set env vars for both cameras
-                env_cam1 = self._set_environment_from_metadata("camera1")
-                env_cam2 = self._set_environment_from_metadata("camera2")
-                env.update(env_cam1)
-                env.update(env_cam2)
+                env = (
+                    self._base_env
+                    | self._pitrac_env
+                    | self._get_metadata_environment("camera1")
+                    | self._get_metadata_environment("camera2")
+                )
                 logger.info("Set environment for both cameras")
             else:
                 # Dual Pi mode: only set env for camera1
-                env_cam1 = self._set_environment_from_metadata("camera1")
-                env.update(env_cam1)
+                env = self._base_env | self._pitrac_env | self._get_metadata_environment("camera1")
                 logger.info("Set environment for camera1 only")
 
             Path(env["PITRAC_BASE_IMAGE_LOGGING_DIR"]).mkdir(parents=True, exist_ok=True)
@@ -245,20 +256,23 @@ class PiTracProcessManager:
 
                 cmd2 = self._build_command(second_camera, config_file_path=generated_config_path)
 
+                log2_offset = self._get_log_size(self.camera2_log_file)
                 with open(self.camera2_log_file, "a") as log2:
                     self.camera2_process = subprocess.Popen(
                         cmd2,
                         stdout=log2,
-                        stderr=subprocess.STDOUT,
+                        stderr=log2,
                         env=env,
                         cwd=str(Path.home()),
-                        preexec_fn=os.setsid,
+                        start_new_session=True,
                     )
 
                     with open(self.camera2_pid_file, "w") as f:
                         f.write(str(self.camera2_process.pid))
 
-                    await asyncio.sleep(self.startup_delay_camera2)
+                    camera2_ready = await self._wait_for_startup(
+                        self.camera2_process, self.camera2_log_file, log2_offset, self.startup_delay_camera2
+                    )
 
                     if self.camera2_process.poll() is None:
                         try:
@@ -267,8 +281,9 @@ class PiTracProcessManager:
                         except (AttributeError, OSError) as e:
                             logger.warning(f"Race condition getting camera2 PID: {e}")
 
-                        logger.info("Waiting for camera2 to be ready before starting camera1...")
-                        await asyncio.sleep(self.startup_wait_camera2_ready)
+                        if not camera2_ready:
+                            logger.info("Waiting for camera2 to be ready before starting camera1...")
+                            await asyncio.sleep(self.startup_wait_camera2_ready)
                     else:
                         logger.error("Camera2 process exited immediately")
                         if self.camera2_process:
@@ -295,20 +310,21 @@ class PiTracProcessManager:
             logger.info(f"Starting {first_camera} process...")
             cmd = self._build_command(first_camera, config_file_path=generated_config_path)
 
+            log_offset = self._get_log_size(self.log_file)
             with open(self.log_file, "a") as log:
                 self.process = subprocess.Popen(
                     cmd,
                     stdout=log,
-                    stderr=subprocess.STDOUT,
+                    stderr=log,
                     env=env,
                     cwd=str(Path.home()),
-                    preexec_fn=os.setsid,
+                    start_new_session=True,
                 )
 
                 with open(self.pid_file, "w") as f:
                     f.write(str(self.process.pid))
 
-                await asyncio.sleep(self.startup_delay_camera1)
+                await self._wait_for_startup(self.process, self.log_file, log_offset, self.startup_delay_camera1)
 
                 if self.process.poll() is None:
                     try:
@@ -412,6 +428,89 @@ class PiTracProcessManager:
             logger.error(f"Failed to start PiTrac: {e}")
             return {"status": "error", "message": f"Failed to start PiTrac: {str(e)}"}
 
+    def _get_log_size(self, log_file: Path) -> int:
+        """Get the current size of a log file, or 0 if it does not exist yet"""
+        try:
+            return log_file.stat().st_size
+        except OSError:
+            return 0
+
+    async def _wait_for_startup(
+        self, process: subprocess.Popen, log_file: Path, log_offset: int, timeout: float
+    ) -> bool:
+        """Wait for a newly started process to become ready
+
+        Returns as soon as the process exits or logs the startup ready marker,
+        otherwise after timeout seconds. The log is read incrementally from
+        log_offset, so each poll only looks at what was written since the last.
+
+        Returns:
+            True if the ready marker was seen in the log
+        """
+        marker = self.startup_ready_marker
+        log = None
+        # Enough of the previous read to catch a marker split across two reads
+        carry = ""
+        try:
+            for _ in range(max(1, int(timeout / self.startup_check_interval))):
+                await asyncio.sleep(self.startup_check_interval)
+                if process.poll() is not None:
+                    return False
+                if not marker:
+                    continue
+                if log is None:
+                    try:
+                        log = open(log_file, "r", errors="replace")
+                    except OSError:
+                        continue
+                    log.seek(log_offset)
+                data = carry + log.read()
+                if marker in data:
+                    return True
+                carry = data[max(0, len(data) - len(marker) + 1) :]
+            return False
+        finally:
+            if log is not None:
+                log.close()
+
+    async def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Wait for a process to exit
+
+        Uses a pidfd where available, which becomes readable the moment the
+        process terminates, so stop() wakes once instead of polling every
+        shutdown_check_interval. Falls back to polling with signal 0.
+
+        Returns:
+            True if the process exited within timeout
+        """
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            for _ in range(int(timeout / self.shutdown_check_interval)):
+                await asyncio.sleep(self.shutdown_check_interval)
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    return True
+            return False
+
+        loop = asyncio.get_running_loop()
+        exited: asyncio.Future[None] = loop.create_future()
+
+        def on_exit() -> None:
+            if not exited.done():
+                exited.set_result(None)
+
+        loop.add_reader(pidfd, on_exit)
+        try:
+            await asyncio.wait_for(exited, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
     async def stop(self) -> Dict[str, Any]:
         """Stop the PiTrac process(es) gracefully - stop camera1 first, then camera2"""
         if not self.is_running():
@@ -432,24 +531,19 @@ class PiTracProcessManager:
                     except ProcessLookupError:
                         pass
 
-                max_wait = self.shutdown_grace_period
-                for _ in range(int(max_wait / self.shutdown_check_interval)):
-                    await asyncio.sleep(self.shutdown_check_interval)
+                # An exited child stays a zombie until reaped below, so signal 0 would
+                # still find it; only probe for a forced kill when the wait timed out
+                if not await self._wait_for_exit(pid, self.shutdown_grace_period):
                     try:
                         os.kill(pid, 0)
+                        logger.warning("PiTrac camera1 didn't stop gracefully, forcing...")
+                        try:
+                            os.killpg(os.getpgid(pid), self.kill_signal)
+                        except (ProcessLookupError, PermissionError):
+                            os.kill(pid, self.kill_signal)
+                        await asyncio.sleep(self.post_kill_delay)
                     except ProcessLookupError:
-                        break
-
-                try:
-                    os.kill(pid, 0)
-                    logger.warning("PiTrac camera1 didn't stop gracefully, forcing...")
-                    try:
-                        os.killpg(os.getpgid(pid), self.kill_signal)
-                    except (ProcessLookupError, PermissionError):
-                        os.kill(pid, self.kill_signal)
-                    await asyncio.sleep(self.post_kill_delay)
-                except ProcessLookupError:
-                    pass
+                        pass
 
                 if self.process:
                     try:
@@ -475,24 +569,17 @@ class PiTracProcessManager:
                     except ProcessLookupError:
                         pass
 
-                max_wait = self.shutdown_grace_period
-                for _ in range(int(max_wait / self.shutdown_check_interval)):
-                    await asyncio.sleep(self.shutdown_check_interval)
+                if not await self._wait_for_exit(camera2_pid, self.shutdown_grace_period):
                     try:
                         os.kill(camera2_pid, 0)
+                        logger.warning("PiTrac camera2 didn't stop gracefully, forcing...")
+                        try:
+                            os.killpg(os.getpgid(camera2_pid), self.kill_signal)
+                        except (ProcessLookupError, PermissionError):
+                            os.kill(camera2_pid, self.kill_signal)
+                        await asyncio.sleep(self.post_kill_delay)
                     except ProcessLookupError:
-                        break
-
-                try:
-                    os.kill(camera2_pid, 0)
-                    logger.warning("PiTrac camera2 didn't stop gracefully, forcing...")
-                    try:
-                        os.killpg(os.getpgid(camera2_pid), self.kill_signal)
-                    except (ProcessLookupError, PermissionError):
-                        os.kill(camera2_pid, self.kill_signal)
-                    await asyncio.sleep(self.post_kill_delay)
-                except ProcessLookupError:
-                    pass
+                        pass
 
                 if self.camera2_process:
                     try:
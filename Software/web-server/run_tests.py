@@ -123,6 +123,10 @@ def main():
         print("Quick Mode: Running unit tests only")
         args = ["-m", "unit", "-v", "--tb=short"]
 
+    elif "--fast" in args:
+        print("Fast Mode: Skipping tests marked slow")
+        args = ["-m", "not slow", "--tb=short"]
+
     elif "--full" in args:
         print("Full Mode: Complete test suite with coverage")
         args = ["-v", "--cov=.", "--cov-report=html", "--cov-report=term-missing"]
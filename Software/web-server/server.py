@@ -5,7 +5,7 @@ import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import stomp
 import yaml
@@ -22,7 +22,9 @@ from constants import (
     DEFAULT_BROKER,
     DEFAULT_PASSWORD,
     DEFAULT_USERNAME,
+    HEARTBEAT_INTERVAL,
     IMAGES_DIR,
+    MAX_MESSAGE_SIZE,
     STOMP_PORT,
 )
 from listeners import ActiveMQListener
@@ -47,6 +49,9 @@ class PiTracServer:
         self.calibration_manager = CalibrationManager(self.config_manager)
         self.testing_manager = TestingToolsManager(self.config_manager)
         self.mq_conn: Optional[stomp.Connection] = None
+        # Connection object reused across reconnect attempts to the same broker
+        self._stomp_conn: Optional[stomp.Connection] = None
+        self._stomp_endpoint: Optional[Tuple[str, int]] = None
         self.listener: Optional[ActiveMQListener] = None
         self.reconnect_task: Optional[asyncio.Task] = None
         self.shutdown_flag = False
@@ -388,13 +393,14 @@ class PiTracServer:
         async def get_testing_status() -> Dict[str, Any]:
             """Get status of running testing tools"""
             running = self.testing_manager.get_running_tools()
+            output = {tool_id: self.testing_manager.get_tool_output(tool_id) for tool_id in running}
 
             results = {}
             if hasattr(self.testing_manager, "completed_results"):
                 results = self.testing_manager.completed_results
                 self.testing_manager.completed_results = {}
 
-            return {"running": running, "results": results}
+            return {"running": running, "output": output, "results": results}
 
         @self.app.post("/api/testing/upload-image")
         async def upload_test_image(file: UploadFile = File(...)) -> Dict[str, Any]:
@@ -706,6 +712,21 @@ class PiTracServer:
             logger.error(f"Error loading config: {e}")
             return {}
 
+    @staticmethod
+    def _positive_int_option(options: Dict[str, Any], key: str) -> Optional[int]:
+        """Read a positive integer option, warning and returning None if it is set to anything else"""
+        value = options.get(key)
+        if value is None:
+            return None
+        try:
+            number = int(value) if not isinstance(value, bool) else 0
+        except (TypeError, ValueError):
+            number = 0
+        if number <= 0:
+            logger.warning(f"Ignoring network.{key}={value!r}: expected a positive integer")
+            return None
+        return number
+
     def setup_activemq(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[stomp.Connection]:
         try:
             config = self._load_config()
@@ -720,13 +741,51 @@ class PiTracServer:
 
             broker_host = broker_address.split(":")[0] if ":" in broker_address else broker_address
 
-            conn = stomp.Connection([(broker_host, STOMP_PORT)])
-
-            self.listener = ActiveMQListener(self.shot_store, self.connection_manager, self.parser, loop)
+            # Reconnects only reopen the socket; a new Connection is built only when
+            # the configured broker changes. Keep message bodies as raw bytes:
+            # msgpack payloads are binary and stomp's default utf-8 decode
+            # (errors="replace") would mangle them. Heartbeats and TCP keepalive let
+            # a silently dropped broker connection be noticed instead of leaving the
+            # subscriber waiting for shots that will never arrive.
+            endpoint = (broker_host, STOMP_PORT)
+            conn = self._stomp_conn
+            if conn is None or self._stomp_endpoint != endpoint:
+                heartbeat_ms = HEARTBEAT_INTERVAL * 1000
+                conn = stomp.Connection(
+                    [endpoint],
+                    auto_decode=False,
+                    heartbeats=(heartbeat_ms, heartbeat_ms),
+                    keepalive=True,
+                )
+                self._stomp_conn = conn
+                self._stomp_endpoint = endpoint
+
+            # One listener for the server's lifetime: reconnects keep its pending
+            # queue and drain task instead of rebuilding them
+            if self.listener is None:
+                self.listener = ActiveMQListener(self.shot_store, self.connection_manager, self.parser, loop)
+            elif loop is not None:
+                self.listener.loop = loop
+            self.listener.conflate_status = bool(network_config.get("conflate_status", False))
+            max_payload_bytes = self._positive_int_option(network_config, "max_payload_bytes")
+            self.listener.max_payload_bytes = max_payload_bytes or MAX_MESSAGE_SIZE
             conn.set_listener("", self.listener)
 
+            # The broker pushes up to prefetchSize messages ahead of acknowledgement;
+            # raise it if bursts of results back up behind slow consumers
+            subscribe_headers = {}
+            prefetch_size = self._positive_int_option(network_config, "prefetch_size")
+            if prefetch_size is not None:
+                subscribe_headers["activemq.prefetchSize"] = str(prefetch_size)
+            # A JMS selector lets the broker drop traffic the listener would skip
+            # anyway (e.g. camera images) before it crosses the wire. Opt-in, since
+            # whether it matches depends on how the sender typed its properties.
+            message_selector = network_config.get("message_selector")
+            if message_selector:
+                subscribe_headers["selector"] = str(message_selector)
+
             conn.connect(username, password, wait=True)
-            conn.subscribe(destination="/topic/Golf.Sim", id=1, ack="auto")
+            conn.subscribe(destination="/topic/Golf.Sim", id=1, ack="auto", headers=subscribe_headers)
 
             logger.info(f"Connected to ActiveMQ at {broker_host}:{STOMP_PORT}")
             return conn
@@ -738,6 +797,20 @@ class PiTracServer:
             logger.error(f"Unexpected error connecting to ActiveMQ: {e}", exc_info=True)
             return None
 
+    async def _wait_for_disconnect(self, timeout: float) -> None:
+        """Wait until the listener reports a dropped connection, or timeout as a backstop"""
+        if self.listener is None:
+            await asyncio.sleep(timeout)
+            return
+
+        event = self.listener.disconnected_event
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        # Caller re-checks is_connected(), so a stale signal only costs one extra check
+        event.clear()
+
     async def reconnect_activemq_loop(self) -> None:
         """Background task to maintain ActiveMQ connection"""
         loop = asyncio.get_event_loop()
@@ -748,7 +821,7 @@ class PiTracServer:
             try:
                 if self.mq_conn and self.mq_conn.is_connected():
                     retry_delay = 5
-                    await asyncio.sleep(10)
+                    await self._wait_for_disconnect(10)
                     continue
 
                 logger.info("ActiveMQ connection lost, attempting to reconnect...")
@@ -839,6 +912,18 @@ class PiTracServer:
             except Exception:
                 pass
 
+    def reset_for_test(self) -> None:
+        """Clear shot data, history, connections, queued messages and tracked tasks so the instance can be reused"""
+        self.shot_store.reset()
+        self.shot_store.clear_history()
+        self.connection_manager._connections.clear()
+        self.background_tasks.clear()
+        if self.listener is not None:
+            with self.listener._pending_lock:
+                self.listener._pending.clear()
+                self.listener._drain_scheduled = False
+            self.listener._drain_task = None
+
 
 server = PiTracServer()
 app = server.app
@@ -8,8 +8,9 @@ import logging
 import os
 import glob
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,22 @@ class TestingToolsManager:
         self.pitrac_binary = "/usr/lib/pitrac/pitrac_lm"
         self.running_processes = {}
         self.completed_results = {}
+        # Rolling stdout/stderr of running tools, bounded so long runs cannot exhaust memory
+        self.max_output_lines = 1000
+        self.output_buffers: Dict[str, Dict[str, Deque[str]]] = {}
+
+        self.home_dir = str(Path.home())
+        self.base_image_dir = str(Path.home() / "LM_Shares/Images")
+
+        # Tool environment: parent environment snapshot plus the fixed PiTrac variables
+        self._tool_env = dict(os.environ) | {
+            "LD_LIBRARY_PATH": "/usr/lib/pitrac",
+            "PITRAC_ROOT": "/usr/lib/pitrac",
+            "PITRAC_MSG_BROKER_FULL_ADDRESS": "tcp://localhost:61616",
+            "PITRAC_BASE_IMAGE_LOGGING_DIR": self.base_image_dir,
+            "PITRAC_WEBSERVER_SHARE_DIR": str(Path.home() / "LM_Shares/WebShare"),
+            "DISPLAY": ":0.0",
+        }
 
         # Create TestImages directory if it doesn't exist
         self.test_images_dir = Path.home() / "LM_Shares/TestImages"
@@ -140,7 +157,7 @@ class TestingToolsManager:
         tool_info = self.tools[tool_id]
 
         try:
-            config_path = self.config_manager.generate_golf_sim_config()
+            config_path = self.config_manager.get_generated_config_path()
 
             # For image test tool, update config with uploaded image
             if tool_info.get("uses_uploaded_image"):
@@ -152,7 +169,8 @@ class TestingToolsManager:
                 latest_image = max(test_images, key=lambda p: p.stat().st_mtime)
                 logger.info(f"Using test image: {latest_image}")
 
-                # Modify the generated config to add test image path
+                # Add the test image path to a copy of the generated config so the
+                # shared generated file stays reusable by other runs
                 import json
 
                 with open(config_path, "r") as f:
@@ -172,52 +190,45 @@ class TestingToolsManager:
                 config_json["gs_config"]["testing"]["kTwoImageTestStrobedImage"] = image_filename
                 config_json["gs_config"]["testing"]["kTwoImageTestPreImage"] = ""  # Optional
 
+                config_path = Path(config_path).with_name("test_image_golf_sim_config.json")
                 with open(config_path, "w") as f:
                     json.dump(config_json, f, indent=2)
 
-            cmd = [self.pitrac_binary]
-
-            system_mode = self.config_manager.get_config().get("system", {}).get("mode", "single")
-            if system_mode == "single" and tool_id not in ["test_gspro_server", "test_e6_connect"]:
-                cmd.append("--run_single_pi")
-
-            cmd.extend(tool_info["args"])
-            cmd.append(f"--config_file={config_path}")
-
             config = self.config_manager.get_config()
 
-            cmd.append("--msg_broker_address=tcp://localhost:61616")
+            system_mode = config.get("system", {}).get("mode", "single")
+            run_single_pi = system_mode == "single" and tool_id not in ["test_gspro_server", "test_e6_connect"]
 
             web_share_dir = (
                 config.get("gs_config", {})
                 .get("ipc_interface", {})
                 .get("kWebServerShareDirectory", "~/LM_Shares/Images/")
             )
-            expanded_web_dir = web_share_dir.replace("~", str(Path.home()))
-            cmd.append(f"--web_server_share_dir={expanded_web_dir}")
-
-            base_image_dir = str(Path.home() / "LM_Shares/Images")
-            cmd.append(f"--base_image_logging_dir={base_image_dir}")
-
-            cmd.append("--logging_level=trace")
-
-            env = os.environ.copy()
-            env["LD_LIBRARY_PATH"] = "/usr/lib/pitrac"
-            env["PITRAC_ROOT"] = "/usr/lib/pitrac"
-            env["PITRAC_MSG_BROKER_FULL_ADDRESS"] = "tcp://localhost:61616"
-            env["PITRAC_BASE_IMAGE_LOGGING_DIR"] = base_image_dir
-            env["PITRAC_WEBSERVER_SHARE_DIR"] = str(Path.home() / "LM_Shares/WebShare")
-            env["DISPLAY"] = ":0.0"
-
-            env_params_cam1 = self.config_manager.get_environment_parameters("camera1")
-            env_params_cam2 = self.config_manager.get_environment_parameters("camera2")
-            merged_config = self.config_manager.get_config()
-
-            for param in env_params_cam1:
+            expanded_web_dir = web_share_dir.replace("~", self.home_dir)
+            base_image_dir = self.base_image_dir
+
+            cmd = [
+                self.pitrac_binary,
+                *(["--run_single_pi"] if run_single_pi else []),
+                *tool_info["args"],
+                f"--config_file={config_path}",
+                "--msg_broker_address=tcp://localhost:61616",
+                f"--web_server_share_dir={expanded_web_dir}",
+                f"--base_image_logging_dir={base_image_dir}",
+                "--logging_level=trace",
+            ]
+
+            config_env = {}
+            env_params = [
+                *self.config_manager.get_environment_parameters("camera1"),
+                *self.config_manager.get_environment_parameters("camera2"),
+            ]
+
+            for param in env_params:
                 key = param["key"]
                 env_var = param["envVariable"]
 
-                value = merged_config
+                value = config
                 for part in key.split("."):
                     if isinstance(value, dict):
                         value = value.get(part)
@@ -226,22 +237,9 @@ class TestingToolsManager:
                         break
 
                 if value is not None and value != "":
-                    env[env_var] = str(value)
-
-            for param in env_params_cam2:
-                key = param["key"]
-                env_var = param["envVariable"]
-
-                value = merged_config
-                for part in key.split("."):
-                    if isinstance(value, dict):
-                        value = value.get(part)
-                    else:
-                        value = None
-                        break
+                    config_env[env_var] = str(value)
 
-                if value is not None and value != "":
-                    env[env_var] = str(value)
+            env = self._tool_env | config_env
 
             if tool_info["requires_sudo"]:
                 cmd = ["sudo", "-E"] + cmd
@@ -254,13 +252,23 @@ class TestingToolsManager:
 
             self.running_processes[tool_id] = process
 
+            stdout_lines: Deque[str] = deque(maxlen=self.max_output_lines)
+            stderr_lines: Deque[str] = deque(maxlen=self.max_output_lines)
+            self.output_buffers[tool_id] = {"stdout": stdout_lines, "stderr": stderr_lines}
+            stdout_task = asyncio.create_task(self._drain_stream(process.stdout, stdout_lines))
+            stderr_task = asyncio.create_task(self._drain_stream(process.stderr, stderr_lines))
+
             start_time = time.time()
 
             try:
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=tool_info["timeout"])
+                # A child that outlives the tool can hold the pipes open, so the drains
+                # share the tool's timeout with the process wait
+                await asyncio.wait_for(
+                    asyncio.gather(process.wait(), stdout_task, stderr_task), timeout=tool_info["timeout"]
+                )
 
-                output = stdout.decode() if stdout else ""
-                error = stderr.decode() if stderr else ""
+                output = "".join(stdout_lines)
+                error = "".join(stderr_lines)
 
                 log_content = await self._find_and_read_test_log(start_time)
                 if log_content:
@@ -289,6 +297,8 @@ class TestingToolsManager:
                 return result
 
             except asyncio.TimeoutError:
+                stdout_task.cancel()
+                stderr_task.cancel()
                 process.terminate()
                 await process.wait()
 
@@ -314,6 +324,10 @@ class TestingToolsManager:
                         "message": f"Tool {tool_id} timed out after {tool_info['timeout']} seconds",
                     }
             finally:
+                for task in (stdout_task, stderr_task):
+                    if not task.done():
+                        task.cancel()
+                self.output_buffers.pop(tool_id, None)
                 if tool_id in self.running_processes:
                     del self.running_processes[tool_id]
 
@@ -351,6 +365,40 @@ class TestingToolsManager:
             logger.error(f"Error stopping tool {tool_id}: {e}")
             return {"status": "error", "message": str(e)}
 
+    async def _drain_stream(self, stream: Optional[asyncio.StreamReader], buffer: Deque[str]) -> None:
+        """Read a process output stream line by line into a bounded buffer
+
+        Args:
+            stream: stdout or stderr of the tool process
+            buffer: Deque that keeps the most recent lines
+        """
+        if stream is None:
+            return
+
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line exceeded the StreamReader limit and was discarded
+                continue
+            if not line:
+                break
+            buffer.append(line.decode(errors="replace"))
+
+    def get_tool_output(self, tool_id: str) -> Dict[str, List[str]]:
+        """Get the output captured so far for a running tool
+
+        Args:
+            tool_id: ID of the tool
+
+        Returns:
+            Dict with the most recent stdout and stderr lines
+        """
+        buffers = self.output_buffers.get(tool_id)
+        if not buffers:
+            return {"stdout": [], "stderr": []}
+        return {name: list(lines) for name, lines in buffers.items()}
+
     async def _find_and_read_test_log(self, start_time: float) -> Optional[str]:
         """Find and read the test log file created after start_time
 
@@ -21,36 +21,71 @@ from utils.mock_factories import (
     MockActiveMQFactory,
     MockWebSocketFactory,
 )
-from utils.test_helpers import ShotDataHelper
+from utils.test_helpers import ConfigTestHelper, ServerStateHelper, ShotDataHelper
 
 
-@pytest.fixture
-def mock_activemq():
-    """Mock ActiveMQ connection using factory"""
-    with patch("server.stomp.Connection") as mock_conn:
-        mock_instance = MockActiveMQFactory.create_connection()
-        mock_conn.return_value = mock_instance
-        yield mock_instance
+@pytest.fixture(scope="session")
+def _stomp_connection(request):
+    """Patch stomp.Connection in the server module once for the whole session"""
+    patcher = patch("server.stomp.Connection")
+    mock_conn = patcher.start()
+    request.addfinalizer(patcher.stop)
+    mock_conn.return_value = MockActiveMQFactory.create_connection()
+    return mock_conn
 
 
-@pytest.fixture
-def server_instance(mock_activemq):
-    """Create PiTracServer instance with mocked dependencies"""
+@pytest.fixture(scope="session")
+def _session_server(_stomp_connection):
+    """Create a single PiTracServer for the whole session with ActiveMQ patched out"""
     server = PiTracServer()
-    server.mq_conn = mock_activemq
+    server.mq_conn = _stomp_connection.return_value
     server.shutdown_flag = False
     server.reconnect_task = None
     return server
 
 
 @pytest.fixture
-def app(server_instance):
-    return server_instance.app
+def mock_activemq(_session_server):
+    """Mock ActiveMQ connection using factory, attached to the shared server"""
+    _session_server.mq_conn = MockActiveMQFactory.create_connection()
+    return _session_server.mq_conn
 
 
 @pytest.fixture
+def server_instance(_session_server):
+    """Shared PiTracServer instance with mocked dependencies"""
+    return _session_server
+
+
+@pytest.fixture(autouse=True)
+def reset_server_state(request):
+    """Restore the shared server after each test that used it.
+
+    Tests replace managers and manager methods on the server and mutate their
+    containers in place, so attributes and container contents are snapshotted
+    up front and put back once the test finishes.
+    """
+    if "_session_server" not in request.fixturenames:
+        yield
+        return
+
+    server = request.getfixturevalue("_session_server")
+    snapshot = ServerStateHelper.snapshot(server)
+
+    yield
+
+    ServerStateHelper.restore(snapshot)
+    server.reset_for_test()
+
+
+@pytest.fixture(scope="session")
+def app(_session_server):
+    return _session_server.app
+
+
+@pytest.fixture(scope="session")
 def client(app):
-    """Create test client for synchronous tests"""
+    """Create test client for synchronous tests, shared across the session"""
     return TestClient(app)
 
 
@@ -61,7 +96,7 @@ async def async_client(app) -> AsyncGenerator:
         yield ac
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_shot_data():
     """Sample shot data for testing using helper"""
     return ShotDataHelper.generate_realistic_shot(
@@ -74,7 +109,7 @@ def sample_shot_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def shot_data_instance():
     """Create a ShotData instance for testing"""
     return ShotData(
@@ -91,40 +126,32 @@ def shot_data_instance():
     )
 
 
-@pytest.fixture
-def mock_home_dir(tmp_path):
-    """Mock home directory for testing with simplified structure"""
-    from utils.test_helpers import ConfigTestHelper
-
-    home = ConfigTestHelper.create_temp_config_dir()
-
-    config = {
-        "network": {
-            "broker_address": "tcp://localhost:61616",
-            "username": "test_user",
-            "password": "test_pass",
-        }
-    }
+@pytest.fixture(scope="session")
+def mock_home_dir(tmp_path_factory):
+    """Mock home directory for testing with simplified structure, built once per session"""
+    home = ConfigTestHelper.create_temp_config_dir(tmp_path_factory.mktemp("home", numbered=False))
 
     config_file = home / ".pitrac" / "config" / "pitrac.yaml"
-    import yaml
-
-    with open(config_file, "w") as f:
-        yaml.dump(config, f)
+    config_file.write_text(
+        "network:\n"
+        '  broker_address: "tcp://localhost:61616"\n'
+        "  username: test_user\n"
+        "  password: test_pass\n"
+    )
 
     yield home
 
 
 @pytest.fixture
 def mock_websocket():
-    """Mock WebSocket for testing using factory"""
-    return MockWebSocketFactory.create_websocket()
+    """Lightweight WebSocket stub for testing using factory"""
+    return MockWebSocketFactory.create_stub()
 
 
-@pytest.fixture
-def websocket_test_client(app):
+@pytest.fixture(scope="session")
+def websocket_test_client(client):
     """Create a simple WebSocket test client"""
-    return TestClient(app)
+    return client
 
 
 @pytest.fixture
@@ -143,9 +170,3 @@ def shot_store():
 def parser():
     """Create ShotDataParser instance for testing"""
     return ShotDataParser()
-
-
-@pytest.fixture
-def shot_simulator():
-    """Shot simulator using helper class"""
-    return ShotDataHelper
@@ -2,8 +2,11 @@ import msgpack
 import pytest
 import asyncio
 import base64
+import json
 from unittest.mock import MagicMock, AsyncMock, patch
+from constants import DRAIN_BATCH_SIZE, MAX_MESSAGE_SIZE
 from listeners import ActiveMQListener
+from models import ShotData
 
 
 @pytest.mark.integration
@@ -37,10 +40,9 @@ class TestActiveMQIntegration:
         mock_frame = MagicMock()
         mock_frame.body = packed_data
 
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine:
-            listener.on_message(mock_frame)
-            mock_run_coroutine.assert_called_once()
-            assert listener.message_count == 1
+        listener.on_message(mock_frame)
+        mock_loop.call_soon_threadsafe.assert_called_once_with(listener._start_drain)
+        assert listener.message_count == 1
 
     def test_activemq_error_handling(self, shot_store, connection_manager, parser):
         """Test ActiveMQ error handling"""
@@ -93,16 +95,28 @@ class TestActiveMQIntegration:
         mock_frame.body = base64_data  # String body with base64 data
         mock_frame.headers = {"encoding": "base64"}
 
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine:
-            listener.on_message(mock_frame)
-            mock_run_coroutine.assert_called_once()
-            assert listener.message_count == 1
+        listener.on_message(mock_frame)
+        mock_loop.call_soon_threadsafe.assert_called_once_with(listener._start_drain)
+        assert listener.message_count == 1
+
+    def test_base64_encoded_bytes_message(self, shot_store, connection_manager, parser):
+        """Test base64 bodies are decoded when they arrive as raw bytes"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        shot_data = {"speed": 150.0, "carry": 270.0, "result_type": 7}
+
+        mock_frame = MagicMock()
+        mock_frame.body = base64.b64encode(msgpack.packb(shot_data))
+        mock_frame.headers = {"encoding": "base64"}
+
+        listener.on_message(mock_frame)
+        assert list(listener._pending) == [(1, shot_data)]
 
     @pytest.mark.asyncio
     async def test_message_to_websocket_flow(self, server_instance, parser):
         """Test complete flow from ActiveMQ message to WebSocket clients"""
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         server_instance.connection_manager._connections.add(mock_ws)
 
         shot_data = {
@@ -123,8 +137,8 @@ class TestActiveMQIntegration:
         server_instance.shot_store.update(parsed_shot)
         await server_instance.connection_manager.broadcast(parsed_shot.to_dict())
 
-        mock_ws.send_json.assert_called_once()
-        sent_data = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called_once()
+        sent_data = json.loads(mock_ws.send_text.call_args[0][0])
 
         assert sent_data["speed"] == 175.0
         assert sent_data["carry"] == 310.0
@@ -132,22 +146,105 @@ class TestActiveMQIntegration:
         assert sent_data["images"] == ["draw_001.jpg", "draw_002.jpg"]
         assert "timestamp" in sent_data
 
-    def test_activemq_config_loading(self, mock_home_dir):
+    def test_activemq_config_loading(self, server_instance, mock_home_dir):
         """Test loading ActiveMQ configuration from config file"""
         with patch(
             "constants.CONFIG_FILE",
             mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
         ):
             with patch("server.stomp.Connection") as mock_conn:
-                from server import PiTracServer
-
-                server = PiTracServer()
+                server = server_instance
                 server.setup_activemq()
 
                 # Check connection was attempted with right params
                 mock_conn.assert_called()
                 call_args = mock_conn.call_args[0][0]
                 assert ("localhost", 61613) in call_args
+                assert mock_conn.call_args.kwargs["auto_decode"] is False
+                assert mock_conn.call_args.kwargs["heartbeats"] == (30000, 30000)
+                assert mock_conn.call_args.kwargs["keepalive"] is True
+
+    @pytest.mark.parametrize(
+        "network_config,expected_headers",
+        [
+            ({}, {}),
+            ({"prefetch_size": 500}, {"activemq.prefetchSize": "500"}),
+            ({"prefetch_size": "lots"}, {}),
+            ({"prefetch_size": 0}, {}),
+            ({"message_selector": "IPCMessageType = '4'"}, {"selector": "IPCMessageType = '4'"}),
+        ],
+    )
+    def test_activemq_subscription_headers_config(self, server_instance, network_config, expected_headers):
+        """Test the subscription only sets prefetch size and selector when configured"""
+        with patch.object(server_instance, "_load_config", return_value={"network": network_config}):
+            with patch("server.stomp.Connection"):
+                conn = server_instance.setup_activemq()
+
+        assert conn.subscribe.call_args.kwargs["headers"] == expected_headers
+
+    def test_activemq_invalid_prefetch_size_still_connects(self, server_instance):
+        """Test a bad prefetch_size is logged and dropped instead of aborting the connection"""
+        network_config = {"prefetch_size": "lots"}
+        with patch.object(server_instance, "_load_config", return_value={"network": network_config}):
+            with patch("server.stomp.Connection"):
+                with patch("server.logger") as mock_logger:
+                    conn = server_instance.setup_activemq()
+
+        assert conn is not None
+        conn.connect.assert_called_once()
+        assert "prefetch_size" in mock_logger.warning.call_args.args[0]
+
+    @pytest.mark.parametrize(
+        "network_config,expected",
+        [
+            ({}, (False, MAX_MESSAGE_SIZE)),
+            ({"conflate_status": True, "max_payload_bytes": 4096}, (True, 4096)),
+            ({"max_payload_bytes": "4096"}, (False, 4096)),
+        ],
+    )
+    def test_activemq_listener_options_config(self, server_instance, network_config, expected):
+        """Test listener options from the network config are applied on every setup"""
+        with patch.object(server_instance, "_load_config", return_value={"network": network_config}):
+            with patch("server.stomp.Connection"):
+                server_instance.setup_activemq()
+
+        listener = server_instance.listener
+        assert (listener.conflate_status, listener.max_payload_bytes) == expected
+
+    @pytest.mark.parametrize("max_payload_bytes", ["1MB", -1, None])
+    def test_activemq_invalid_max_payload_bytes_falls_back(self, server_instance, max_payload_bytes):
+        """Test a bad max_payload_bytes uses the default limit and still connects"""
+        network_config = {"max_payload_bytes": max_payload_bytes}
+        with patch.object(server_instance, "_load_config", return_value={"network": network_config}):
+            with patch("server.stomp.Connection"):
+                with patch("server.logger") as mock_logger:
+                    conn = server_instance.setup_activemq()
+
+        assert conn is not None
+        conn.connect.assert_called_once()
+        assert server_instance.listener.max_payload_bytes == MAX_MESSAGE_SIZE
+        warned = [call.args[0] for call in mock_logger.warning.call_args_list]
+        assert any("max_payload_bytes" in message for message in warned) is (max_payload_bytes is not None)
+
+    def test_listener_and_connection_reused_across_reconnects(self, server_instance, mock_home_dir):
+        """Test setup_activemq keeps one listener and stomp Connection across attempts"""
+        with patch(
+            "constants.CONFIG_FILE",
+            mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
+        ):
+            with patch("server.stomp.Connection") as mock_conn_cls:
+                first_conn = server_instance.setup_activemq()
+                listener = server_instance.listener
+
+                new_loop = MagicMock()
+                second_conn = server_instance.setup_activemq(new_loop)
+
+        assert server_instance.listener is listener
+        assert listener.loop is new_loop
+
+        mock_conn_cls.assert_called_once()
+        assert second_conn is first_conn
+        assert first_conn.connect.call_count == 2
 
     def test_activemq_reconnection_logic(self, shot_store, connection_manager, parser):
         """Test ActiveMQ reconnection behavior"""
@@ -176,16 +273,14 @@ class TestActiveMQIntegration:
         assert listener.connected is False
 
     @pytest.mark.asyncio
-    async def test_server_reconnection_task_startup(self, mock_home_dir):
+    async def test_server_reconnection_task_startup(self, server_instance, mock_home_dir):
         """Test that reconnection task starts on server startup"""
         with patch(
             "constants.CONFIG_FILE",
             mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
         ):
             with patch("server.stomp.Connection"):
-                from server import PiTracServer
-
-                server = PiTracServer()
+                server = server_instance
                 server.shutdown_flag = False
 
                 with patch("asyncio.create_task") as mock_create_task:
@@ -193,16 +288,14 @@ class TestActiveMQIntegration:
                     mock_create_task.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_server_reconnection_loop(self, mock_home_dir):
+    async def test_server_reconnection_loop(self, server_instance, mock_home_dir):
         """Test the reconnection loop behavior"""
         with patch(
             "constants.CONFIG_FILE",
             mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
         ):
             with patch("server.stomp.Connection"):
-                from server import PiTracServer
-
-                server = PiTracServer()
+                server = server_instance
                 server.shutdown_flag = False
 
                 mock_conn = MagicMock()
@@ -225,17 +318,52 @@ class TestActiveMQIntegration:
 
                     assert mock_setup.call_count >= 1
 
+    def test_disconnect_signals_event_loop(self, shot_store, connection_manager, parser):
+        """Test disconnects and heartbeat timeouts are forwarded to the event loop"""
+        mock_loop = MagicMock()
+        listener = ActiveMQListener(shot_store, connection_manager, parser, mock_loop)
+
+        listener.on_disconnected()
+        listener.on_heartbeat_timeout()
+
+        assert mock_loop.call_soon_threadsafe.call_count == 2
+        mock_loop.call_soon_threadsafe.assert_called_with(listener.disconnected_event.set)
+
     @pytest.mark.asyncio
-    async def test_server_shutdown_cleanup(self, mock_home_dir):
+    async def test_reconnect_loop_wakes_on_disconnect(self, server_instance, shot_store, connection_manager, parser):
+        """Test the reconnect monitor reacts to a disconnect without waiting out its poll"""
+        server = server_instance
+        server.shutdown_flag = False
+        server.listener = ActiveMQListener(shot_store, connection_manager, parser, asyncio.get_running_loop())
+        server.mq_conn = MagicMock()
+        server.mq_conn.is_connected.return_value = True
+
+        def reconnect(loop):
+            server.shutdown_flag = True
+            return MagicMock()
+
+        with patch.object(server, "setup_activemq", side_effect=reconnect) as mock_setup:
+            reconnect_task = asyncio.create_task(server.reconnect_activemq_loop())
+            await asyncio.sleep(0.05)
+            mock_setup.assert_not_called()
+
+            server.mq_conn.is_connected.return_value = False
+            server.listener.on_disconnected()
+
+            # Far below the 10 second backstop
+            await asyncio.wait_for(reconnect_task, timeout=1)
+
+        mock_setup.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_server_shutdown_cleanup(self, server_instance, mock_home_dir):
         """Test proper cleanup during shutdown"""
         with patch(
             "constants.CONFIG_FILE",
             mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
         ):
             with patch("server.stomp.Connection"):
-                from server import PiTracServer
-
-                server = PiTracServer()
+                server = server_instance
                 server.shutdown_flag = False
 
                 mock_conn = MagicMock()
@@ -309,31 +437,181 @@ class TestActiveMQIntegration:
         mock_frame = MagicMock()
         mock_frame.body = packed_data
 
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run:
+        listener.on_message(mock_frame)
+
+        # Let the loop run the scheduled callback, then wait for any drain task
+        # (with no websocket clients the callback updates the store itself)
+        await asyncio.sleep(0)
+        if listener._drain_task is not None:
+            await listener._drain_task
+
+        stored = server_instance.shot_store.get()
+        assert stored.carry == 250.5
+        assert abs(stored.speed - 145.4) < 0.1  # m/s to mph conversion
+
+    def test_array_format_parsed_on_receiver_thread(self, shot_store, connection_manager, parser):
+        """Test array messages are queued already parsed, and bad arrays are dropped"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        shot = [250.5, 65.0, 13.5, -2.3, 3100, -400, 0.95, 1, 7, "Strike", [], []]
+        listener.on_message(MagicMock(body=msgpack.packb(shot)))
+
+        ((message_number, queued),) = listener._pending
+        assert message_number == 1
+        assert isinstance(queued, ShotData)
+        assert queued.carry == 250.5
+
+        with patch("listeners.logger") as mock_logger:
+            listener.on_message(MagicMock(body=msgpack.packb([1.0, 2.0])))
+            mock_logger.error.assert_called()
+        assert len(listener._pending) == 1
+
+    @pytest.mark.parametrize("payload", [42, "text", True])
+    def test_unsupported_payload_type_rejected(self, shot_store, connection_manager, parser, payload):
+        """Test top-level msgpack values other than arrays and maps are dropped"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        with patch("listeners.logger") as mock_logger:
+            listener.on_message(MagicMock(body=msgpack.packb(payload)))
+
+        assert any("Unsupported message payload type" in str(call) for call in mock_logger.error.call_args_list)
+        assert len(listener._pending) == 0
+
+    @pytest.mark.asyncio
+    async def test_message_burst_drained_in_order(self, shot_store, connection_manager, parser):
+        """Test a burst of messages schedules one drain that processes them in order"""
+        mock_loop = MagicMock()
+        listener = ActiveMQListener(shot_store, connection_manager, parser, mock_loop)
+        connection_manager.broadcast_many = AsyncMock()
+
+        for speed in (100.0, 110.0, 120.0):
+            mock_frame = MagicMock()
+            mock_frame.body = msgpack.packb({"speed": speed, "result_type": 7})
             listener.on_message(mock_frame)
-            mock_run.assert_called_once()
 
-            # Extract the coroutine that was passed
-            coro = mock_run.call_args[0][0]
-            # Run it directly
-            await coro
+        mock_loop.call_soon_threadsafe.assert_called_once()
+        with patch("listeners.logger") as mock_logger:
+            await listener._drain_pending()
+
+        # Each update is logged with its own message number, not the latest count
+        messages = [call.args[0] % call.args[1:] for call in mock_logger.info.call_args_list]
+        processed = [message for message in messages if "Processed" in message]
+        expected = ["Processed shot #1", "Processed shot #2", "Processed shot #3"]
+        assert [line.split(":")[0] for line in processed] == expected
 
-            stored = server_instance.shot_store.get()
-            assert stored.carry == 250.5
-            assert abs(stored.speed - 145.4) < 0.1  # m/s to mph conversion
+        # One batched broadcast carrying every update in arrival order
+        connection_manager.broadcast_many.assert_awaited_once()
+        speeds = [payload["speed"] for payload in connection_manager.broadcast_many.call_args.args[0]]
+        assert speeds == [100.0, 110.0, 120.0]
+        assert shot_store.get().speed == 120.0
+
+        # Once drained, the next message schedules a fresh drain
+        mock_frame = MagicMock()
+        mock_frame.body = msgpack.packb({"speed": 130.0})
+        listener.on_message(mock_frame)
+        assert mock_loop.call_soon_threadsafe.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_reconnection_with_exponential_backoff(self, mock_home_dir):
+    async def test_long_burst_drained_in_capped_batches(self, shot_store, connection_manager, parser):
+        """Test a burst larger than DRAIN_BATCH_SIZE is split into batches with a yield between them"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+        connection_manager.broadcast_many = AsyncMock()
+
+        for speed in range(DRAIN_BATCH_SIZE * 2 + 10):
+            listener.on_message(MagicMock(body=msgpack.packb({"speed": float(speed)})))
+
+        with patch("listeners.logger"), patch("listeners.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await listener._drain_pending()
+
+        batches = [call.args[0] for call in connection_manager.broadcast_many.call_args_list]
+        assert [len(batch) for batch in batches] == [DRAIN_BATCH_SIZE, DRAIN_BATCH_SIZE, 10]
+        assert [payload["speed"] for batch in batches for payload in batch] == [
+            float(speed) for speed in range(DRAIN_BATCH_SIZE * 2 + 10)
+        ]
+        assert mock_sleep.await_count == 2
+        assert listener._drain_scheduled is False
+
+    @pytest.mark.asyncio
+    async def test_drain_without_clients_skips_task(self, shot_store, connection_manager, parser):
+        """Test a burst with no websocket clients updates the store from the loop callback"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+        connection_manager.broadcast_many = AsyncMock()
+
+        for speed in (100.0, 110.0):
+            listener.on_message(MagicMock(body=msgpack.packb({"speed": speed, "result_type": 7})))
+
+        listener._start_drain()
+
+        assert listener._drain_task is None
+        assert listener._drain_scheduled is False
+        assert shot_store.get().speed == 110.0
+        connection_manager.broadcast_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drain_without_clients_hands_long_burst_to_task(self, shot_store, connection_manager, parser):
+        """Test messages past the first batch are left to a drain task"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        for speed in range(DRAIN_BATCH_SIZE + 1):
+            listener.on_message(MagicMock(body=msgpack.packb({"speed": float(speed), "result_type": 7})))
+
+        listener._start_drain()
+        assert len(listener._pending) == 1
+        await listener._drain_task
+
+        assert listener._drain_scheduled is False
+        assert shot_store.get().speed == float(DRAIN_BATCH_SIZE)
+
+    @pytest.mark.parametrize(
+        "conflate_status,expected_messages",
+        [
+            (False, ["Initializing", "Hit", "Waiting For Ball", "Ball Placed"]),
+            (True, ["Hit", "Ball Placed"]),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_status_conflation_within_batch(
+        self, shot_store, connection_manager, parser, conflate_status, expected_messages
+    ):
+        """Test superseded status updates are only dropped when conflation is enabled"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+        listener.conflate_status = conflate_status
+        connection_manager.broadcast_many = AsyncMock()
+
+        for result_type, message in ((1, "Initializing"), (7, "Hit"), (2, "Waiting For Ball"), (6, "Ball Placed")):
+            body = msgpack.packb({"speed": 150.0, "result_type": result_type, "message": message})
+            listener.on_message(MagicMock(body=body))
+
+        await listener._drain_pending()
+
+        sent = connection_manager.broadcast_many.call_args.args[0]
+        assert [payload["message"] for payload in sent] == expected_messages
+        assert shot_store.get().message == "Ball Placed"
+
+    def test_drain_schedule_failure_resets_state(self, shot_store, connection_manager, parser):
+        """Test a failed drain schedule does not leave the listener stuck"""
+        mock_loop = MagicMock()
+        mock_loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
+        listener = ActiveMQListener(shot_store, connection_manager, parser, mock_loop)
+
+        mock_frame = MagicMock()
+        mock_frame.body = msgpack.packb({"speed": 100.0})
+        listener.on_message(mock_frame)
+
+        assert listener._drain_scheduled is False
+        assert len(listener._pending) == 0
+
+    @pytest.mark.asyncio
+    async def test_reconnection_with_exponential_backoff(self, server_instance, mock_home_dir):
         """Test that reconnection uses exponential backoff"""
         with patch(
             "constants.CONFIG_FILE",
             mock_home_dir / ".pitrac" / "config" / "pitrac.yaml",
         ):
             with patch("server.stomp.Connection"):
-                from server import PiTracServer
-
-                server = PiTracServer()
+                server = server_instance
                 server.shutdown_flag = False
+                server.mq_conn = None
 
                 sleep_delays = []
 
@@ -352,9 +630,8 @@ class TestActiveMQIntegration:
                     assert sleep_delays[0] == 5  # Initial retry delay
                     assert sleep_delays[1] == 10  # Doubled delay
 
-    @pytest.mark.asyncio
-    async def test_process_broadcast_value_error(self):
-        """Test _process_and_broadcast handling ValueError"""
+    def test_process_value_error(self):
+        """Test _process handling ValueError"""
         mock_loop = MagicMock()
         shot_store = MagicMock()
         connection_manager = MagicMock()
@@ -364,13 +641,11 @@ class TestActiveMQIntegration:
 
         parser.parse_dict_format.side_effect = ValueError("Invalid format")
 
-        await listener._process_and_broadcast({"invalid": "data"})
-
+        assert listener._process({"invalid": "data"}, 1) is None
         assert shot_store.update.call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_process_broadcast_general_exception(self):
-        """Test _process_and_broadcast handling general Exception"""
+    def test_process_general_exception(self):
+        """Test _process handling general Exception"""
         mock_loop = MagicMock()
         shot_store = MagicMock()
         connection_manager = MagicMock()
@@ -380,16 +655,36 @@ class TestActiveMQIntegration:
 
         shot_store.update.side_effect = Exception("Unexpected error")
 
-        from models import ShotData
-
         mock_shot = ShotData(speed=100.0)
         parser.parse_dict_format.return_value = mock_shot
         parser.validate_shot_data.return_value = True
 
-        await listener._process_and_broadcast({"speed": 100.0})
-
+        assert listener._process({"speed": 100.0}, 1) is None
         assert shot_store.update.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_status_message_preserves_shot_data(self, shot_store, connection_manager, parser):
+        """Test a status message only replaces status fields on the current shot"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+        connection_manager.broadcast_many = AsyncMock()
+        listener._pending.extend(
+            [(1, {"speed": 150.0, "carry": 270.0, "result_type": 7}), (2, {"result_type": 6, "message": "Ball placed"})]
+        )
+        listener._drain_scheduled = True
+
+        with patch.object(parser, "validate_shot_data", wraps=parser.validate_shot_data) as validate:
+            await listener._drain_pending()
+        updated = shot_store.get()
+
+        # Only the shot goes through range validation
+        validate.assert_called_once()
+        (shot,) = validate.call_args.args
+
+        assert updated is not shot
+        assert (updated.speed, updated.carry) == (150.0, 270.0)
+        assert (updated.result_type, updated.message) == ("Ball Placed", "Ball placed")
+        connection_manager.broadcast_many.assert_awaited_once_with([shot.to_dict(), updated.to_dict()])
+
     @pytest.mark.asyncio
     async def test_validate_shot_data_warning_path(self):
         """Test warning path when shot data validation fails"""
@@ -400,18 +695,18 @@ class TestActiveMQIntegration:
 
         listener = ActiveMQListener(shot_store, connection_manager, parser, mock_loop)
 
-        from models import ShotData
-
         mock_shot = ShotData(speed=100.0)
         parser.parse_dict_format.return_value = mock_shot
         parser.validate_shot_data.return_value = False
 
-        connection_manager.broadcast = AsyncMock()
+        connection_manager.broadcast_many = AsyncMock()
+        listener._pending.append((1, {"speed": 100.0}))
+        listener._drain_scheduled = True
 
-        await listener._process_and_broadcast({"speed": 100.0})
+        await listener._drain_pending()
 
         assert shot_store.update.call_count == 1
-        assert connection_manager.broadcast.called
+        connection_manager.broadcast_many.assert_awaited_once_with([mock_shot.to_dict()])
 
     def test_base64_decode_failure(self, shot_store, connection_manager, parser):
         """Test handling of failed base64 decode"""
@@ -443,6 +738,81 @@ class TestActiveMQIntegration:
             # Empty message is returned, so no error
             assert listener.message_count == 1
 
+    @pytest.mark.parametrize("ipc_type,queued", [("1", False), ("2", False), ("6", False), ("4", True)])
+    def test_ipc_message_type_filter(self, shot_store, connection_manager, parser, ipc_type, queued):
+        """Test image and image-request messages are dropped on the header alone"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        mock_frame = MagicMock()
+        mock_frame.body = msgpack.packb({"speed": 150.0})
+        mock_frame.headers = {"IPCMessageType": ipc_type}
+
+        with patch.object(listener, "_extract_message_data", wraps=listener._extract_message_data) as extract:
+            listener.on_message(mock_frame)
+
+        assert extract.called is queued
+        assert len(listener._pending) == (1 if queued else 0)
+        assert listener.message_count == 1
+
+    def test_oversized_message_skipped_before_extraction(self, shot_store, connection_manager, parser):
+        """Test content-length above MAX_MESSAGE_SIZE drops a str body without extracting it"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        mock_frame = MagicMock()
+        mock_frame.body = "\u00ff" * 16
+        mock_frame.headers = {"content-length": str(MAX_MESSAGE_SIZE + 1), "IPCMessageType": "4"}
+
+        with patch.object(listener, "_extract_message_data") as extract:
+            listener.on_message(mock_frame)
+
+        extract.assert_not_called()
+        assert len(listener._pending) == 0
+
+    def test_oversized_body_without_content_length_skipped(self, shot_store, connection_manager, parser):
+        """Test the raw body length gates extraction when the broker sends no content-length"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        mock_frame = MagicMock()
+        mock_frame.body = b"\x00" * (MAX_MESSAGE_SIZE + 1)
+        mock_frame.headers = {}
+
+        with patch.object(listener, "_extract_message_data") as extract:
+            listener.on_message(mock_frame)
+
+        extract.assert_not_called()
+        assert len(listener._pending) == 0
+
+    def test_bytes_body_size_ignores_content_length(self, shot_store, connection_manager, parser):
+        """Test a bytes body is gated on its own length without parsing content-length"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+
+        mock_frame = MagicMock()
+        mock_frame.body = msgpack.packb({"speed": 150.0})
+        mock_frame.headers = {"content-length": str(len(mock_frame.body)), "IPCMessageType": "4"}
+
+        with patch.object(listener, "_content_length") as content_length:
+            listener.on_message(mock_frame)
+
+        content_length.assert_not_called()
+        assert list(listener._pending) == [(1, {"speed": 150.0})]
+
+    def test_max_payload_bytes_configurable(self, shot_store, connection_manager, parser):
+        """Test the size gate follows max_payload_bytes"""
+        listener = ActiveMQListener(shot_store, connection_manager, parser, MagicMock())
+        assert listener.max_payload_bytes == MAX_MESSAGE_SIZE
+
+        listener.max_payload_bytes = 16
+        listener.on_message(MagicMock(body=msgpack.packb({"message": "x" * 32}), headers={}))
+        assert len(listener._pending) == 0
+
+        large = {"message": "x" * (MAX_MESSAGE_SIZE + 1)}
+        listener.max_payload_bytes = 2 * MAX_MESSAGE_SIZE
+        listener.on_message(MagicMock(body=msgpack.packb(large), headers={}))
+        assert list(listener._pending) == [(2, large)]
+
+        with pytest.raises(ValueError):
+            listener.max_payload_bytes = 0
+
     def test_large_binary_data_handling(self, shot_store, connection_manager, parser):
         """Test handling of large binary data without IPCMessageType"""
         mock_loop = MagicMock()
@@ -469,10 +839,9 @@ class TestActiveMQIntegration:
         mock_frame.body = packed_data.decode("latin-1")
         mock_frame.headers = {}  # No headers, will go through UTF-8 path
 
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine:
-            listener.on_message(mock_frame)
-            # Message should be processed
-            assert listener.message_count == 1
+        listener.on_message(mock_frame)
+        # Message should be processed
+        assert listener.message_count == 1
 
     def test_unknown_body_type_iterable(self, shot_store, connection_manager, parser):
         """Test handling of iterable body type"""
@@ -486,9 +855,8 @@ class TestActiveMQIntegration:
         mock_frame.body = list(packed_data)
         mock_frame.headers = {}
 
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine:
-            listener.on_message(mock_frame)
-            mock_run_coroutine.assert_called_once()
+        listener.on_message(mock_frame)
+        mock_loop.call_soon_threadsafe.assert_called_once()
 
     def test_unknown_body_type_conversion(self, shot_store, connection_manager, parser):
         """Test conversion of unknown body types"""
@@ -1,45 +1,73 @@
 """Test suite for ConfigManager using pytest"""
 
+import functools
 import json
 import os
 import pytest
-import tempfile
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
 from config_manager import ConfigurationManager as ConfigManager
+from utils.test_helpers import ConfigTestHelper
+
+CAMERA1_GAIN = "gs_config.cameras.kCamera1Gain"
+GSPRO_PORT = "gs_config.golf_simulator_interfaces.GSPro.kGSProConnectPort"
+BASE_USER_SETTINGS = {"gs_config": {"cameras": {"kCamera1Gain": "2.0"}}}
 
 
 class TestConfigManager:
     """Test the configuration manager functionality"""
 
     @pytest.fixture
-    def temp_config_dir(self):
-        """Create a temporary directory for config files"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    @pytest.fixture
-    def config_manager(self, temp_config_dir):
+    def config_manager(self, tmp_path):
         """Create a ConfigManager instance with temp paths"""
         manager = ConfigManager()
-        manager.user_settings_path = temp_config_dir / "user_settings.json"
+        manager.user_settings_path = tmp_path / "user_settings.json"
+        manager.generated_config_path = tmp_path / "generated_golf_sim_config.json"
         return manager
 
+    @pytest.fixture(scope="module")
+    def base_user_settings_file(self, tmp_path_factory):
+        """Write the baseline user settings file once per module"""
+        path = tmp_path_factory.mktemp("config") / "user_settings.json"
+        ConfigTestHelper.write_config_file(path, BASE_USER_SETTINGS)
+        return path
+
+    @pytest.fixture(scope="module")
+    def make_manager(self, tmp_path_factory):
+        """Return a factory that loads one shared ConfigManager per distinct user settings document.
+
+        Managers are cached, so only tests that don't modify the manager should use it.
+        """
+
+        @functools.lru_cache(maxsize=32)
+        def build(user_settings_json: str) -> ConfigManager:
+            path = tmp_path_factory.mktemp("cached") / "user_settings.json"
+            path.write_text(user_settings_json)
+            manager = ConfigManager()
+            manager.user_settings_path = path
+            manager.reload()
+            return manager
+
+        return lambda user_settings: build(json.dumps(user_settings, sort_keys=True))
+
     @pytest.fixture
-    def setup_config_files(self, config_manager):
-        """Setup basic config files"""
-        user_settings = {"gs_config": {"cameras": {"kCamera1Gain": "2.0"}}}
+    def loaded_config_manager(self, make_manager):
+        """Shared read-only ConfigManager loaded with the baseline user settings"""
+        return make_manager(BASE_USER_SETTINGS)
 
-        with open(config_manager.user_settings_path, "w") as f:
-            json.dump(user_settings, f)
+    @pytest.fixture
+    def setup_config_files(self, config_manager, base_user_settings_file):
+        """Setup basic config files"""
+        shutil.copy(base_user_settings_file, config_manager.user_settings_path)
 
         config_manager.reload()
         return config_manager
 
-    def test_config_loading_and_merging(self, setup_config_files):
+    def test_config_loading_and_merging(self, loaded_config_manager):
         """Test loading and merging of system and user configs"""
-        config_manager = setup_config_files
+        config_manager = loaded_config_manager
 
         camera1_gain = config_manager.get_config("gs_config.cameras.kCamera1Gain")
         assert camera1_gain is not None
@@ -61,33 +89,29 @@ class TestConfigManager:
         camera2_gain = config_manager.get_config("gs_config.cameras.kCamera2Gain")
         assert camera2_gain is not None
 
-    def test_config_validation_gain(self, config_manager):
-        """Test configuration validation for camera gain"""
-        is_valid, error = config_manager.validate_config("gs_config.cameras.kCamera1Gain", "0.0")
-        assert not is_valid
-        assert "minimum" in error.lower() or "at least" in error.lower()
-
-        is_valid, error = config_manager.validate_config("gs_config.cameras.kCamera1Gain", "20.0")
-        assert not is_valid
-        assert "maximum" in error.lower() or "at most" in error.lower()
-
-        is_valid, _ = config_manager.validate_config("gs_config.cameras.kCamera1Gain", "8.0")
-        assert is_valid
-
-    def test_config_validation_port(self, config_manager):
-        """Test configuration validation for network ports"""
-        is_valid, _ = config_manager.validate_config("gs_config.golf_simulator_interfaces.GSPro.kGSProConnectPort", "0")
-        assert not is_valid
-
-        is_valid, _ = config_manager.validate_config(
-            "gs_config.golf_simulator_interfaces.GSPro.kGSProConnectPort", "70000"
-        )
-        assert not is_valid
-
-        is_valid, _ = config_manager.validate_config(
-            "gs_config.golf_simulator_interfaces.GSPro.kGSProConnectPort", "8080"
-        )
-        assert is_valid
+    @pytest.fixture(scope="module")
+    def validation_manager(self):
+        """Shared ConfigManager for validation checks, which only read metadata"""
+        return ConfigManager()
+
+    @pytest.mark.parametrize(
+        "key,value,expected_valid,error_terms",
+        [
+            (CAMERA1_GAIN, "0.0", False, ("minimum", "at least")),
+            (CAMERA1_GAIN, "20.0", False, ("maximum", "at most")),
+            (CAMERA1_GAIN, "8.0", True, ()),
+            (GSPRO_PORT, "0", False, ()),
+            (GSPRO_PORT, "70000", False, ()),
+            (GSPRO_PORT, "8080", True, ()),
+        ],
+        ids=["gain-min", "gain-max", "gain-mid", "port-low", "port-high", "port-mid"],
+    )
+    def test_config_validation_edge_cases(self, validation_manager, key, value, expected_valid, error_terms):
+        """Test configuration validation at the gain and port range boundaries"""
+        is_valid, error = validation_manager.validate_config(key, value)
+        assert is_valid == expected_valid
+        if error_terms:
+            assert any(term in error.lower() for term in error_terms)
 
     def test_reset_all(self, setup_config_files):
         """Test resetting all user settings"""
@@ -106,9 +130,9 @@ class TestConfigManager:
         assert isinstance(categories, dict)
         assert "Cameras" in categories or len(categories) == 0
 
-    def test_get_diff(self, setup_config_files):
+    def test_get_diff(self, loaded_config_manager):
         """Test getting differences between system and user configs"""
-        config_manager = setup_config_files
+        config_manager = loaded_config_manager
 
         diff = config_manager.get_diff()
         assert isinstance(diff, dict)
@@ -116,9 +140,9 @@ class TestConfigManager:
         diff_entry = diff["gs_config.cameras.kCamera1Gain"]
         assert "user" in diff_entry and "default" in diff_entry
 
-    def test_get_user_settings(self, setup_config_files):
+    def test_get_user_settings(self, loaded_config_manager):
         """Test getting user settings"""
-        config_manager = setup_config_files
+        config_manager = loaded_config_manager
 
         user_settings = config_manager.get_user_settings()
         assert isinstance(user_settings, dict)
@@ -197,9 +221,9 @@ class TestConfigManager:
         gain_value = config_manager.get_config("gs_config.cameras.kCamera1Gain")
         assert gain_value is not None
 
-    @patch.dict(os.environ, {"HOME": "/test/home"})
-    def test_default_paths(self):
+    def test_default_paths(self, monkeypatch):
         """Test default configuration file paths"""
+        monkeypatch.setenv("HOME", "/test/home")
         manager = ConfigManager()
 
         assert "/test/home/.pitrac" in str(manager.user_settings_path)
@@ -228,3 +252,31 @@ class TestConfigManager:
 
         is_valid, _ = config_manager.validate_config("gs_config.cameras.kCamera1Gain", "20.0")
         assert not is_valid
+
+    def test_generated_config_path_is_reused(self, setup_config_files):
+        """Test that the generated config is only rebuilt when it is stale"""
+        config_manager = setup_config_files
+
+        with patch.object(
+            config_manager, "generate_golf_sim_config", wraps=config_manager.generate_golf_sim_config
+        ) as mock_generate:
+            first = config_manager.get_generated_config_path()
+            second = config_manager.get_generated_config_path()
+
+        assert first == second
+        assert first.exists()
+        assert mock_generate.call_count == 1
+
+    def test_generated_config_path_regenerates_after_settings_change(self, setup_config_files):
+        """Test that saving user settings invalidates the generated config"""
+        config_manager = setup_config_files
+        generated_path = config_manager.get_generated_config_path()
+        stale_mtime = generated_path.stat().st_mtime_ns
+        os.utime(config_manager.user_settings_path, ns=(stale_mtime + 1, stale_mtime + 1))
+
+        with patch.object(
+            config_manager, "generate_golf_sim_config", wraps=config_manager.generate_golf_sim_config
+        ) as mock_generate:
+            config_manager.get_generated_config_path()
+
+        assert mock_generate.call_count == 1
@@ -2,7 +2,10 @@
 Comprehensive tests for the PiTrac Process Manager
 """
 
+import asyncio
+import os
 import signal
+import subprocess
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock, mock_open
@@ -172,6 +175,17 @@ class TestPiTracProcessManager:
         assert isinstance(env, dict)
         assert len(env) > 0
 
+    def test_metadata_environment_only_contains_metadata_vars(self, manager, mock_config_manager):
+        """Test that the metadata overlay does not include the parent environment"""
+        mock_config_manager.get_environment_parameters.return_value = [
+            {"key": "logging.level", "envVariable": "PITRAC_LOG_LEVEL"}
+        ]
+        mock_config_manager.get_config.return_value = {"logging": {"level": "debug"}}
+
+        env = manager._get_metadata_environment("camera1")
+
+        assert env == {"PITRAC_LOG_LEVEL": "debug"}
+
     def test_build_command_with_config_file(self, manager):
         """Test command building includes config file"""
         with patch("pathlib.Path.exists", return_value=True):
@@ -273,6 +287,7 @@ class TestPiTracProcessManager:
         assert status["camera1_pid"] == 12345
         assert status["camera2_pid"] == 54321
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_start_success(self, manager):
         """Test successful start of pitrac process"""
@@ -298,6 +313,102 @@ class TestPiTracProcessManager:
             assert result.get("pid") == 12345 or result.get("camera1_pid") == 12345
             assert manager.process == mock_process
 
+    @pytest.mark.asyncio
+    async def test_wait_for_startup_returns_on_marker(self, manager, tmp_path):
+        """Test that startup wait ends once the ready marker is logged"""
+        log_file = tmp_path / "pitrac.log"
+        log_file.write_text("old run: Ready\n")
+        offset = log_file.stat().st_size
+        log_file.write_text("old run: Ready\nstarting\nReady\n")
+        manager.startup_ready_marker = "Ready"
+
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            ready = await manager._wait_for_startup(mock_process, log_file, offset, 3)
+
+        assert ready is True
+        assert mock_sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_startup_ignores_marker_before_offset(self, manager, tmp_path):
+        """Test that a marker from a previous run does not count"""
+        log_file = tmp_path / "pitrac.log"
+        log_file.write_text("old run: Ready\n")
+        manager.startup_ready_marker = "Ready"
+
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            ready = await manager._wait_for_startup(mock_process, log_file, log_file.stat().st_size, 3)
+
+        assert ready is False
+        assert mock_sleep.call_count == 30
+
+    @pytest.mark.asyncio
+    async def test_wait_for_startup_reads_log_incrementally(self, manager, tmp_path):
+        """Test that a marker split across two polls is still found"""
+        log_file = tmp_path / "pitrac.log"
+        log_file.write_text("")
+        manager.startup_ready_marker = "Waiting For Ball"
+        chunks = iter(["starting\nWaiting F", "or Ball\n"])
+
+        async def append_chunk(_):
+            with open(log_file, "a") as f:
+                f.write(next(chunks, ""))
+
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+
+        with patch("asyncio.sleep", new_callable=AsyncMock, side_effect=append_chunk) as mock_sleep:
+            ready = await manager._wait_for_startup(mock_process, log_file, 0, 3)
+
+        assert ready is True
+        assert mock_sleep.call_count == 2
+
+    def test_startup_defaults(self, manager):
+        """Test that the ready marker is opt-in and startup has its own poll interval"""
+        assert manager.startup_ready_marker == ""
+        assert manager.startup_check_interval == 0.1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_startup_returns_on_exit(self, manager, tmp_path):
+        """Test that startup wait ends as soon as the process exits"""
+        mock_process = Mock()
+        mock_process.poll.return_value = 1
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            ready = await manager._wait_for_startup(mock_process, tmp_path / "pitrac.log", 0, 3)
+
+        assert ready is False
+        assert mock_sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_start_popen_arguments(self, manager):
+        """Test that stdout and stderr share the log file and the child gets its own session"""
+        mock_process = Mock()
+        mock_process.pid = 12345
+        mock_process.poll.return_value = None
+
+        with patch("subprocess.Popen", return_value=mock_process) as mock_popen:
+            with patch("builtins.open", mock_open()):
+                with patch("pitrac_manager.Path.exists", return_value=True):
+                    with patch("pitrac_manager.Path.mkdir"):
+                        with patch.object(manager, "is_running", return_value=False):
+                            with patch.object(
+                                manager.config_manager, "generate_golf_sim_config", return_value="/tmp/test_config.json"
+                            ):
+                                with patch("asyncio.sleep", new_callable=AsyncMock):
+                                    await manager.start()
+
+        for call in mock_popen.call_args_list:
+            kwargs = call.kwargs
+            assert kwargs["stderr"] is kwargs["stdout"]
+            assert kwargs["start_new_session"] is True
+            assert "preexec_fn" not in kwargs
+
     @pytest.mark.asyncio
     async def test_start_already_running(self, manager):
         """Test start when process is already running"""
@@ -389,6 +500,29 @@ class TestPiTracProcessManager:
         assert "stopped" in result["message"].lower()
         assert manager.process is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open not available")
+    async def test_wait_for_exit_wakes_on_exit(self, manager):
+        """Test the pidfd wait returns as soon as the process exits, zombie or not"""
+        process = subprocess.Popen(["sleep", "30"])
+        try:
+            asyncio.get_running_loop().call_later(0.05, process.terminate)
+            assert await asyncio.wait_for(manager._wait_for_exit(process.pid, 5), 2) is True
+        finally:
+            process.kill()
+            process.wait()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open not available")
+    async def test_wait_for_exit_times_out(self, manager):
+        """Test the pidfd wait reports a process that outlives the timeout"""
+        process = subprocess.Popen(["sleep", "30"])
+        try:
+            assert await manager._wait_for_exit(process.pid, 0.05) is False
+        finally:
+            process.kill()
+            process.wait()
+
     @pytest.mark.asyncio
     async def test_stop_not_running(self, manager):
         """Test stop when process is not running"""
@@ -399,6 +533,7 @@ class TestPiTracProcessManager:
         assert result["status"] == "not_running"
         assert "not running" in result["message"]
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_stop_with_kill_fallback(self, manager):
         """Test stop with kill fallback when terminate fails"""
@@ -501,6 +636,7 @@ class TestPiTracProcessManager:
             assert result.get("pid") == 67890 or result.get("camera1_pid") == 67890
             assert manager.process == mock_process_new
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_restart_not_running(self, manager):
         """Test restart when process is not running - should start"""
@@ -1,8 +1,11 @@
 import asyncio
 import time
+from datetime import datetime
 import pytest
 from unittest.mock import patch, AsyncMock
 from models import ShotData, ResultType
+from parsers import ShotDataParser
+from utils.test_helpers import shot_simulator
 
 
 @pytest.mark.integration
@@ -10,7 +13,7 @@ class TestShotSimulation:
     """Test realistic shot simulation scenarios"""
 
     @pytest.mark.asyncio
-    async def test_rapid_shot_sequence(self, server_instance, parser, shot_simulator):
+    async def test_rapid_shot_sequence(self, server_instance, parser):
         """Test handling rapid sequence of shots"""
         shots = shot_simulator.generate_shot_sequence(10)
 
@@ -25,7 +28,7 @@ class TestShotSimulation:
             await asyncio.sleep(0.01)
 
     @pytest.mark.asyncio
-    async def test_concurrent_shot_updates(self, server_instance, parser, shot_simulator):
+    async def test_concurrent_shot_updates(self, server_instance, parser):
         """Test handling concurrent shot updates"""
         shots = shot_simulator.generate_shot_sequence(5)
 
@@ -40,7 +43,7 @@ class TestShotSimulation:
         stored_shot = server_instance.shot_store.get()
         assert stored_shot.speed > 0
 
-    def test_shot_data_validation(self, shot_simulator):
+    def test_shot_data_validation(self):
         """Test shot data validation and bounds"""
         shot = shot_simulator.generate_realistic_shot()
 
@@ -83,10 +86,10 @@ class TestShotSimulation:
 
     @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_sustained_shot_stream(self, server_instance, parser, shot_simulator):
+    async def test_sustained_shot_stream(self, server_instance, parser):
         """Test sustained stream of shots over time"""
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         server_instance.connection_manager._connections.add(mock_ws)
 
         start_time = time.time()
@@ -102,12 +105,10 @@ class TestShotSimulation:
             await asyncio.sleep(0.1)
 
         assert shot_count > 0
-        assert mock_ws.send_json.call_count == shot_count
+        assert mock_ws.send_text.call_count == shot_count
 
     def test_shot_result_types(self):
         """Test different shot result types with C++ string mapping"""
-        from parsers import ShotDataParser
-
         result_types = {
             ResultType.UNKNOWN: "Unknown",
             ResultType.INITIALIZING: "Initializing",
@@ -124,11 +125,15 @@ class TestShotSimulation:
                 mapped_string == expected_text
             ), f"Expected '{expected_text}', got '{mapped_string}' for {enum_val.name}"
 
+    @pytest.mark.parametrize("result_type", [-1, 11, "Hit"])
+    def test_unknown_result_type_raises(self, result_type):
+        """Test values outside the C++ range fall through to the ResultType lookup and fail"""
+        with pytest.raises(ValueError):
+            ShotDataParser._get_result_type_string(result_type)
+
     @pytest.mark.asyncio
-    async def test_shot_timestamp_generation(self, server_instance, parser, shot_simulator):
+    async def test_shot_timestamp_generation(self, server_instance, parser):
         """Test that timestamps are properly generated"""
-        from datetime import datetime
-
         shot = shot_simulator.generate_realistic_shot()
 
         before = datetime.now()
@@ -143,8 +148,48 @@ class TestShotSimulation:
         timestamp = datetime.fromisoformat(stored_shot.timestamp)
         assert before <= timestamp <= after
 
+    def test_partial_update_merges_into_current(self, parser):
+        """Test dict updates overlay the current shot without mutating it"""
+        current = ShotData(speed=150.0, carry=270.0, message="Previous", images=["a.png"])
+
+        parsed_shot = parser.parse_dict_format({"speed": 160.04, "message": "Next"}, current)
+
+        assert parsed_shot is not current
+        assert (parsed_shot.speed, parsed_shot.message) == (160.0, "Next")
+        assert (parsed_shot.carry, parsed_shot.images) == (270.0, ["a.png"])
+        assert parsed_shot.images is not current.images
+        assert (current.speed, current.message) == (150.0, "Previous")
+
+    @pytest.mark.parametrize(
+        "result_type,message,is_shot",
+        [
+            (7, "Hit", True),
+            (7, "Club type was set", False),
+            (6, "Ball Placed", False),
+            (0, "Unknown", False),
+        ],
+    )
+    def test_array_status_messages_carry_no_shot_values(self, parser, result_type, message, is_shot):
+        """Test status and configuration arrays are zeroed while real hits keep their values"""
+        data = [250.0, 65.0, 13.5, -2.3, 3100, -400, 0.95, 1, result_type, message, [], ["shot.png"]]
+
+        parsed_shot = parser.parse_array_format(data)
+
+        assert parsed_shot.message == message
+        assert (parsed_shot.carry == 250.0) is is_shot
+        assert parsed_shot.images == (["shot.png"] if is_shot else [])
+
+    def test_dict_unknown_result_type_keeps_shot_values(self, parser):
+        """Test an unknown integer result type is labelled without dropping the current shot"""
+        current = ShotData(speed=150.0, carry=270.0, result_type="Hit", images=["a.png"])
+
+        parsed_shot = parser.parse_dict_format({"result_type": 99}, current)
+
+        assert parsed_shot.result_type == "Type 99"
+        assert (parsed_shot.speed, parsed_shot.carry, parsed_shot.images) == (150.0, 270.0, ["a.png"])
+
     @pytest.mark.asyncio
-    async def test_shot_data_persistence(self, server_instance, parser, shot_simulator):
+    async def test_shot_data_persistence(self, server_instance, parser):
         """Test that shot data persists between requests"""
         shot = shot_simulator.generate_realistic_shot()
         current = server_instance.shot_store.get()
@@ -169,7 +214,7 @@ class TestShotSimulation:
             ("wedge", (70, 100), (50, 120)),
         ],
     )
-    def test_club_specific_shots(self, shot_simulator, club_type, speed_range, carry_range):
+    def test_club_specific_shots(self, club_type, speed_range, carry_range):
         """Test generating club-specific shot data"""
         shot = shot_simulator.generate_realistic_shot(speed_range=speed_range, carry_range=carry_range)
 
@@ -195,7 +240,7 @@ class TestShotSimulation:
         assert parser.validate_shot_data(invalid_shot) is False
 
     @pytest.mark.asyncio
-    async def test_shot_history(self, server_instance, shot_simulator):
+    async def test_shot_history(self, server_instance):
         """Test shot history tracking"""
         for i in range(5):
             shot = ShotData(
@@ -1,122 +1,104 @@
+import importlib
 import pytest
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
+EXPECTED_MODULE_ATTRS = {
+    "main": ["app"],
+    "server": ["PiTracServer", "app"],
+    "models": ["ShotData", "ResultType"],
+    "managers": ["ConnectionManager", "ShotDataStore"],
+    "parsers": ["ShotDataParser"],
+    "listeners": ["ActiveMQListener"],
+    "constants": ["MPS_TO_MPH"],
+    "config_manager": ["ConfigurationManager"],
+    "pitrac_manager": ["PiTracProcessManager"],
+    "camera_detector": ["CameraDetector"],
+    "calibration_manager": ["CalibrationManager"],
+    "testing_tools_manager": ["TestingToolsManager"],
+}
+
+EXPECTED_ROUTES = {
+    # Core routes
+    "/",
+    "/health",
+    "/ws",
+
+    # Shot data routes
+    "/api/shot",
+    "/api/reset",
+    "/api/history",
+    "/api/stats",
+
+    # Config routes
+    "/config",
+    "/api/config",
+    "/api/config/defaults",
+    "/api/config/user",
+    "/api/config/categories",
+    "/api/config/metadata",
+    "/api/config/diff",
+    "/api/config/{key:path}",
+    "/api/config/reset",
+    "/api/config/reload",
+    "/api/config/export",
+    "/api/config/import",
+
+    # PiTrac process management routes
+    "/api/pitrac/start",
+    "/api/pitrac/stop",
+    "/api/pitrac/restart",
+    "/api/pitrac/status",
+
+    # Calibration routes
+    "/calibration",
+    "/api/calibration/status",
+    "/api/calibration/data",
+    "/api/calibration/ball-location/{camera}",
+    "/api/calibration/auto/{camera}",
+    "/api/calibration/manual/{camera}",
+    "/api/calibration/capture/{camera}",
+    "/api/calibration/stop",
+
+    # Testing tools routes
+    "/testing",
+    "/api/testing/tools",
+    "/api/testing/run/{tool_id}",
+    "/api/testing/stop/{tool_id}",
+    "/api/testing/status",
+
+    # Camera routes
+    "/api/cameras/detect",
+    "/api/cameras/types",
+
+    # Logs routes
+    "/logs",
+    "/ws/logs",
+    "/api/logs/services",
+}
+
 
 @pytest.mark.unit
 class TestSmoke:
     """Basic smoke tests to verify the system is working"""
 
-    def test_imports(self):
-        """Test that all required modules can be imported"""
-
-    def test_main_module_imports(self):
-        """Test that main module can be imported"""
-        parent = Path(__file__).parent.parent
-        if str(parent) not in sys.path:
-            sys.path.insert(0, str(parent))
-
-        import main
-        import server
-
-        assert hasattr(main, "app")
-        assert hasattr(server, "PiTracServer")
-        assert hasattr(server, "app")
-
-    def test_new_module_imports(self):
-        """Test that new modular structure imports work"""
-        parent = Path(__file__).parent.parent
-        if str(parent) not in sys.path:
-            sys.path.insert(0, str(parent))
-
-        import models
-        import managers
-        import parsers
-        import listeners
-        import constants
-        import config_manager
-        import pitrac_manager
-        import camera_detector
-        import calibration_manager
-        import testing_tools_manager
-
-        assert hasattr(models, "ShotData")
-        assert hasattr(models, "ResultType")
-        assert hasattr(managers, "ConnectionManager")
-        assert hasattr(managers, "ShotDataStore")
-        assert hasattr(parsers, "ShotDataParser")
-        assert hasattr(listeners, "ActiveMQListener")
-        assert hasattr(constants, "MPS_TO_MPH")
-        assert hasattr(config_manager, "ConfigurationManager")
-        assert hasattr(pitrac_manager, "PiTracProcessManager")
-        assert hasattr(camera_detector, "CameraDetector")
-        assert hasattr(calibration_manager, "CalibrationManager")
-        assert hasattr(testing_tools_manager, "TestingToolsManager")
+    @pytest.mark.parametrize("module", list(EXPECTED_MODULE_ATTRS))
+    def test_module_imports(self, module):
+        """Test that each module of the modular structure imports and exposes its API"""
+        mod = importlib.import_module(module)
+        missing = [attr for attr in EXPECTED_MODULE_ATTRS[module] if not hasattr(mod, attr)]
+        assert not missing, f"{module} is missing {missing}"
 
     def test_fastapi_app_exists(self, app):
         """Test that FastAPI app is properly configured"""
         assert app is not None
         assert app.title == "PiTrac Dashboard"
 
-        routes = [route.path for route in app.routes]
-        # Core routes
-        assert "/" in routes
-        assert "/health" in routes
-        assert "/ws" in routes
-
-        # Shot data routes
-        assert "/api/shot" in routes
-        assert "/api/reset" in routes
-        assert "/api/history" in routes
-        assert "/api/stats" in routes
-
-        # Config routes
-        assert "/config" in routes
-        assert "/api/config" in routes
-        assert "/api/config/defaults" in routes
-        assert "/api/config/user" in routes
-        assert "/api/config/categories" in routes
-        assert "/api/config/metadata" in routes
-        assert "/api/config/diff" in routes
-        assert "/api/config/{key:path}" in routes
-        assert "/api/config/reset" in routes
-        assert "/api/config/reload" in routes
-        assert "/api/config/export" in routes
-        assert "/api/config/import" in routes
-
-        # PiTrac process management routes
-        assert "/api/pitrac/start" in routes
-        assert "/api/pitrac/stop" in routes
-        assert "/api/pitrac/restart" in routes
-        assert "/api/pitrac/status" in routes
-
-        # Calibration routes
-        assert "/calibration" in routes
-        assert "/api/calibration/status" in routes
-        assert "/api/calibration/data" in routes
-        assert "/api/calibration/ball-location/{camera}" in routes
-        assert "/api/calibration/auto/{camera}" in routes
-        assert "/api/calibration/manual/{camera}" in routes
-        assert "/api/calibration/capture/{camera}" in routes
-        assert "/api/calibration/stop" in routes
-
-        # Testing tools routes
-        assert "/testing" in routes
-        assert "/api/testing/tools" in routes
-        assert "/api/testing/run/{tool_id}" in routes
-        assert "/api/testing/stop/{tool_id}" in routes
-        assert "/api/testing/status" in routes
-
-        # Camera routes
-        assert "/api/cameras/detect" in routes
-        assert "/api/cameras/types" in routes
-
-        # Logs routes
-        assert "/logs" in routes
-        assert "/ws/logs" in routes
-        assert "/api/logs/services" in routes
+        routes = {route.path for route in app.routes}
+        missing = EXPECTED_ROUTES - routes
+        assert not missing, f"Missing routes: {sorted(missing)}"
 
+    @pytest.mark.slow
     def test_templates_exist(self):
         """Test that template files exist"""
         template_dir = Path(__file__).parent.parent / "templates"
@@ -125,6 +107,7 @@ class TestSmoke:
         dashboard = template_dir / "dashboard.html"
         assert dashboard.exists()
 
+    @pytest.mark.slow
     def test_static_files_exist(self):
         """Test that static files exist"""
         static_dir = Path(__file__).parent.parent / "static"
@@ -153,6 +136,48 @@ class TestSmoke:
         assert shot_dict["side_spin"] == 0
         assert shot_dict["result_type"] == "Waiting for ball..."
 
+    def test_reset_for_test_clears_state(self, server_instance, mock_websocket):
+        """Test that reset_for_test returns the server to its initial state"""
+        from models import ShotData
+
+        from listeners import ActiveMQListener
+
+        server_instance.listener = ActiveMQListener(
+            server_instance.shot_store, server_instance.connection_manager, server_instance.parser
+        )
+        server_instance.shot_store.update(ShotData(speed=120.0, result_type="Hit"))
+        server_instance.connection_manager._connections.add(mock_websocket)
+        server_instance.listener._pending.append((1, {"speed": 120.0}))
+        server_instance.listener._drain_scheduled = True
+
+        server_instance.reset_for_test()
+
+        assert server_instance.shot_store.get().speed == 0.0
+        assert server_instance.shot_store.get_history() == []
+        assert server_instance.connection_manager.connection_count == 0
+        assert not server_instance.listener._pending
+        assert server_instance.listener._drain_scheduled is False
+
+    def test_server_state_snapshot_restores_containers(self, server_instance):
+        """Test that in-place container changes are undone, not only rebound attributes"""
+        from utils.test_helpers import ServerStateHelper
+
+        calibration_status = server_instance.calibration_manager.calibration_status
+        saved_status = dict(calibration_status)
+        original_pitrac_manager = server_instance.pitrac_manager
+        snapshot = ServerStateHelper.snapshot(server_instance)
+
+        calibration_status["camera1"] = {"status": "leaked"}
+        server_instance.shot_store._history.append(object())
+        server_instance.pitrac_manager = None
+
+        ServerStateHelper.restore(snapshot)
+
+        assert server_instance.calibration_manager.calibration_status is calibration_status
+        assert calibration_status == saved_status
+        assert server_instance.shot_store._history == []
+        assert server_instance.pitrac_manager is original_pitrac_manager
+
     def test_environment_detection(self):
         """Test that testing environment is detected"""
         import os
@@ -171,6 +196,30 @@ class TestSmoke:
         assert isinstance(shot_dict, dict)
         assert shot_dict["speed"] == 150.0
         assert shot_dict["carry"] == 250.0
+        assert not hasattr(shot, "__dict__")
+
+    def test_shot_data_to_dict_matches_asdict(self):
+        """Test the hand-written to_dict stays in step with the dataclass fields"""
+        from dataclasses import asdict
+        from models import ShotData
+
+        shot = ShotData(speed=150.0, result_type="Hit", timestamp="2024-01-01T12:00:00", images=["a.jpg"])
+        shot_dict = shot.to_dict()
+
+        assert list(shot_dict.items()) == list(asdict(shot).items())
+        assert shot_dict["images"] is not shot.images
+
+    def test_shot_data_with_status(self):
+        """Test with_status swaps the status and keeps the shot values"""
+        from models import ShotData
+
+        shot = ShotData(speed=150.0, carry=250.0, result_type="Hit", message="Nice", images=["a.jpg"])
+        updated = shot.with_status("Ball Placed", "Ready", "2024-01-01T12:00:00")
+
+        assert (updated.result_type, updated.message) == ("Ball Placed", "Ready")
+        assert updated.timestamp == "2024-01-01T12:00:00"
+        assert (updated.speed, updated.carry, updated.images) == (150.0, 250.0, ["a.jpg"])
+        assert (shot.result_type, shot.message) == ("Hit", "Nice")
 
     def test_connection_manager(self, connection_manager):
         """Test ConnectionManager basic functionality"""
@@ -193,6 +242,17 @@ class TestSmoke:
         reset_shot = shot_store.reset()
         assert reset_shot.speed == 0.0
 
+    def test_shot_store_update_status(self, shot_store):
+        """Test update_status replaces only the status fields of the stored shot"""
+        from models import ShotData
+
+        shot_store.update(ShotData(speed=100.0, result_type="Hit", message="Nice"))
+        updated = shot_store.update_status("Ball Placed", "Ready", "2024-01-01T12:00:00")
+
+        assert shot_store.get() is updated
+        assert (updated.speed, updated.result_type, updated.message) == (100.0, "Ball Placed", "Ready")
+        assert len(shot_store.get_history()) == 1
+
     def test_parser(self, parser):
         """Test ShotDataParser basic functionality"""
         from models import ShotData
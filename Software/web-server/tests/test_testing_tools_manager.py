@@ -17,13 +17,26 @@ def mock_config_manager():
             "ipc_interface": {"kWebServerShareDirectory": "~/LM_Shares/Images/"}
         },
     }
-    manager.generate_golf_sim_config.return_value = "/tmp/test_config.json"
+    manager.get_generated_config_path.return_value = "/tmp/test_config.json"
     manager.get_environment_parameters.return_value = [
         {"key": "camera1.slot1_camera_type", "envVariable": "PITRAC_SLOT1_CAMERA_TYPE"}
     ]
     return manager
 
 
+def make_process(returncode=0, stdout=b"", stderr=b""):
+    """Create a mock tool process whose output streams are already complete"""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.stdout = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stdout.feed_eof()
+    process.stderr = asyncio.StreamReader()
+    process.stderr.feed_data(stderr)
+    process.stderr.feed_eof()
+    return process
+
+
 @pytest.fixture
 def testing_manager(mock_config_manager, tmp_path):
     """Create TestingToolsManager instance for testing"""
@@ -118,9 +131,7 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_run_tool_success(self, testing_manager, mock_config_manager):
         """Test successfully running a tool"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"Test output", b"")
+        mock_process = make_process(stdout=b"Test output")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await testing_manager.run_tool("pulse_test")
@@ -130,12 +141,35 @@ class TestRunTool:
         assert result["return_code"] == 0
         assert "timestamp" in result
 
+    @pytest.mark.asyncio
+    async def test_run_tool_streams_output(self, testing_manager, mock_config_manager):
+        """Test that tool output is collected line by line"""
+        mock_process = make_process(stdout=b"line 1\nline 2\n", stderr=b"warning\n")
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            result = await testing_manager.run_tool("camera1_still")
+
+        assert result["output"].startswith("line 1\nline 2\n")
+        assert result["error"] == "warning\n"
+        assert "camera1_still" not in testing_manager.output_buffers
+
+    @pytest.mark.asyncio
+    async def test_run_tool_output_is_bounded(self, testing_manager, mock_config_manager):
+        """Test that only the most recent output lines are kept"""
+        testing_manager.max_output_lines = 10
+        stdout = "".join(f"line {i}\n" for i in range(50)).encode()
+        mock_process = make_process(stdout=stdout)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            result = await testing_manager.run_tool("camera1_still")
+
+        assert "line 49" in result["output"]
+        assert "line 39\n" not in result["output"]
+
     @pytest.mark.asyncio
     async def test_run_tool_failure(self, testing_manager, mock_config_manager):
         """Test running a tool that fails"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = (b"", b"Error occurred")
+        mock_process = make_process(returncode=1, stderr=b"Error occurred")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await testing_manager.run_tool("camera1_still")
@@ -147,10 +181,8 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_run_tool_timeout(self, testing_manager, mock_config_manager):
         """Test tool timeout handling"""
-        mock_process = AsyncMock()
-        mock_process.communicate.side_effect = asyncio.TimeoutError()
-        mock_process.terminate = AsyncMock()
-        mock_process.wait = AsyncMock()
+        mock_process = make_process()
+        mock_process.wait = AsyncMock(side_effect=[asyncio.TimeoutError(), None])
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await testing_manager.run_tool("camera1_still")
@@ -159,13 +191,24 @@ class TestRunTool:
         assert "timed out" in result["message"]
         mock_process.terminate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_tool_timeout_with_pipes_held_open(self, testing_manager, mock_config_manager):
+        """Test that output left open after the tool exits still hits the timeout"""
+        testing_manager.tools["camera1_still"]["timeout"] = 0.05
+        mock_process = make_process()
+        mock_process.stdout = asyncio.StreamReader()
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            result = await asyncio.wait_for(testing_manager.run_tool("camera1_still"), timeout=1)
+
+        assert result["status"] == "timeout"
+        mock_process.terminate.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_run_continuous_test_timeout(self, testing_manager, mock_config_manager):
         """Test continuous test timeout behavior"""
-        mock_process = AsyncMock()
-        mock_process.communicate.side_effect = asyncio.TimeoutError()
-        mock_process.terminate = AsyncMock()
-        mock_process.wait = AsyncMock()
+        mock_process = make_process()
+        mock_process.wait = AsyncMock(side_effect=[asyncio.TimeoutError(), None])
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             with patch.object(testing_manager, "_find_and_read_test_log", return_value="Test log content"):
@@ -177,9 +220,7 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_run_tool_with_sudo(self, testing_manager, mock_config_manager):
         """Test running a tool that requires sudo"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"Output", b"")
+        mock_process = make_process(stdout=b"Output")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
             await testing_manager.run_tool("test_images")
@@ -192,7 +233,7 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_run_tool_exception(self, testing_manager, mock_config_manager):
         """Test exception handling during tool run"""
-        mock_config_manager.generate_golf_sim_config.side_effect = Exception("Config error")
+        mock_config_manager.get_generated_config_path.side_effect = Exception("Config error")
 
         result = await testing_manager.run_tool("camera1_still")
         assert result["status"] == "error"
@@ -208,9 +249,7 @@ class TestRunTool:
         # Mock config file operations
         config_content = '{"gs_config": {}}'
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"Test completed", b"")
+        mock_process = make_process(stdout=b"Test completed")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             with patch("builtins.open", mock_open(read_data=config_content)):
@@ -228,9 +267,7 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_run_still_capture_basic(self, testing_manager):
         """Test still image capture runs successfully"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"Image captured", b"")
+        mock_process = make_process(stdout=b"Image captured")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await testing_manager.run_tool("camera1_still")
@@ -507,6 +544,40 @@ class TestExtractTimingSummary:
         assert "30ms" in result
 
 
+@pytest.mark.unit
+class TestGetToolOutput:
+    """Test get_tool_output method"""
+
+    def test_get_tool_output_not_running(self, testing_manager):
+        """Test output of a tool that is not running"""
+        assert testing_manager.get_tool_output("pulse_test") == {"stdout": [], "stderr": []}
+
+    @pytest.mark.asyncio
+    async def test_get_tool_output_while_running(self, testing_manager, mock_config_manager):
+        """Test that partial output is available before the tool exits"""
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = asyncio.StreamReader()
+        mock_process.stderr = asyncio.StreamReader()
+        exited = asyncio.Event()
+        mock_process.wait = AsyncMock(side_effect=exited.wait)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            task = asyncio.create_task(testing_manager.run_tool("camera1_still"))
+            mock_process.stdout.feed_data(b"progress\n")
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+            assert testing_manager.get_tool_output("camera1_still")["stdout"] == ["progress\n"]
+
+            mock_process.stdout.feed_eof()
+            mock_process.stderr.feed_eof()
+            exited.set()
+            result = await task
+
+        assert result["status"] == "success"
+
+
 @pytest.mark.unit
 class TestGetRunningTools:
     """Test get_running_tools method"""
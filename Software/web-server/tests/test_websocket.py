@@ -1,7 +1,9 @@
 import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock
 from models import ShotData
+from utils.mock_factories import MockWebSocketFactory
 
 
 @pytest.mark.websocket
@@ -101,6 +103,12 @@ class TestWebSocket:
             assert "speed" in data2
             assert data2["speed"] == 200.0
 
+    def test_json_fallback_matches_send_json(self):
+        """Test the json fallback keeps non-ASCII text unescaped, as send_json does"""
+        from managers import _json_dumps
+
+        assert _json_dumps({"message": "Señor"}) == '{"message":"Señor"}'
+
 
 @pytest.mark.asyncio
 @pytest.mark.websocket
@@ -110,25 +118,25 @@ class TestWebSocketAsync:
     async def test_websocket_broadcast(self, server_instance, shot_data_instance):
         """Test broadcasting to WebSocket clients"""
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
 
         server_instance.connection_manager._connections.add(mock_ws)
 
         await server_instance.connection_manager.broadcast(shot_data_instance.to_dict())
 
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called_once()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["speed"] == 145.5
         assert call_args["carry"] == 265.3
 
     async def test_websocket_broadcast_to_multiple_clients(self, server_instance, shot_data_instance):
         """Test that updates are broadcast to all connected clients"""
         mock_ws1 = AsyncMock()
-        mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
         mock_ws2 = AsyncMock()
-        mock_ws2.send_json = AsyncMock()
+        mock_ws2.send_text = AsyncMock()
         mock_ws3 = AsyncMock()
-        mock_ws3.send_json = AsyncMock()
+        mock_ws3.send_text = AsyncMock()
 
         server_instance.connection_manager._connections.add(mock_ws1)
         server_instance.connection_manager._connections.add(mock_ws2)
@@ -137,23 +145,26 @@ class TestWebSocketAsync:
         await server_instance.connection_manager.broadcast(shot_data_instance.to_dict())
 
         # All clients should receive the update
-        mock_ws1.send_json.assert_called_once()
-        mock_ws2.send_json.assert_called_once()
-        mock_ws3.send_json.assert_called_once()
+        mock_ws1.send_text.assert_called_once()
+        mock_ws2.send_text.assert_called_once()
+        mock_ws3.send_text.assert_called_once()
+
+        # Every client receives the same serialized text
+        assert mock_ws1.send_text.call_args[0][0] is mock_ws2.send_text.call_args[0][0]
 
         # Verify the data sent
         for mock_ws in [mock_ws1, mock_ws2, mock_ws3]:
-            call_args = mock_ws.send_json.call_args[0][0]
+            call_args = json.loads(mock_ws.send_text.call_args[0][0])
             assert call_args["speed"] == 145.5
             assert call_args["carry"] == 265.3
 
     async def test_websocket_failed_client_removed(self, server_instance, shot_data_instance):
         """Test that failed clients are removed from the list"""
         mock_ws_good = AsyncMock()
-        mock_ws_good.send_json = AsyncMock()
+        mock_ws_good.send_text = AsyncMock()
 
         mock_ws_bad = AsyncMock()
-        mock_ws_bad.send_json = AsyncMock(side_effect=Exception("Connection lost"))
+        mock_ws_bad.send_text = AsyncMock(side_effect=Exception("Connection lost"))
 
         server_instance.connection_manager._connections.add(mock_ws_good)
         server_instance.connection_manager._connections.add(mock_ws_bad)
@@ -163,17 +174,90 @@ class TestWebSocketAsync:
         await server_instance.connection_manager.broadcast(shot_data_instance.to_dict())
 
         # Good client should receive the update
-        mock_ws_good.send_json.assert_called_once()
+        mock_ws_good.send_text.assert_called_once()
 
         # Bad client should be removed
         assert server_instance.connection_manager.connection_count == 1
         assert mock_ws_bad not in server_instance.connection_manager._connections
         assert mock_ws_good in server_instance.connection_manager._connections
 
+    async def test_broadcast_many_sends_each_payload_in_order(self, connection_manager):
+        """Test batched broadcasts deliver one JSON message per payload to every client"""
+        ws1 = MockWebSocketFactory.create_stub()
+        ws2 = MockWebSocketFactory.create_stub()
+        await connection_manager.connect(ws1)
+        await connection_manager.connect(ws2)
+
+        payloads = [{"speed": 100.0, "message": "first"}, {"speed": 110.0, "message": "second"}]
+        await connection_manager.broadcast_many(payloads)
+
+        for ws in (ws1, ws2):
+            assert [json.loads(text) for text in ws.sent] == payloads
+
+    async def test_broadcast_matches_send_json_encoding(self, connection_manager, shot_data_instance):
+        """Test broadcast text decodes to the payload and is as compact as send_json's"""
+        ws = MockWebSocketFactory.create_stub()
+        await connection_manager.connect(ws)
+        payload = shot_data_instance.to_dict()
+
+        await connection_manager.broadcast(payload)
+
+        assert json.loads(ws.sent[0]) == payload
+        assert len(ws.sent[0]) == len(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+
+    async def test_broadcast_many_skips_unencodable_payload(self, connection_manager):
+        """Test a payload JSON cannot encode is dropped and the rest still go out"""
+        ws = MockWebSocketFactory.create_stub()
+        await connection_manager.connect(ws)
+        config_update = {"type": "config_update", "value": {1: 2**70}}
+
+        await connection_manager.broadcast_many([{"speed": 100.0}, {"bad": object()}, config_update])
+
+        expected = [{"speed": 100.0}, {"type": "config_update", "value": {"1": 2**70}}]
+        assert [json.loads(text) for text in ws.sent] == expected
+
+    async def test_broadcast_many_removes_failed_client(self, connection_manager):
+        """Test a client failing mid-batch is dropped without affecting others"""
+        good_ws = MockWebSocketFactory.create_stub()
+        bad_ws = AsyncMock()
+        bad_ws.send_text = AsyncMock(side_effect=Exception("Connection lost"))
+        connection_manager._connections.update({good_ws, bad_ws})
+
+        await connection_manager.broadcast_many([{"speed": 100.0}, {"speed": 110.0}])
+
+        assert len(good_ws.sent) == 2
+        bad_ws.send_text.assert_awaited_once()
+        assert connection_manager.connections == [good_ws]
+
+    async def test_broadcast_many_slow_client_does_not_block_others(self, connection_manager):
+        """Test clients are written concurrently so a stalled send only delays that client"""
+        release = asyncio.Event()
+
+        async def stalled_send(text):
+            await release.wait()
+
+        slow_ws = AsyncMock()
+        slow_ws.send_text = AsyncMock(side_effect=stalled_send)
+        fast_ws = MockWebSocketFactory.create_stub()
+        connection_manager._connections.update({slow_ws, fast_ws})
+
+        broadcast = asyncio.create_task(connection_manager.broadcast_many([{"speed": 100.0}, {"speed": 110.0}]))
+        # One turn to start the broadcast, one for the per-client sends it gathers
+        for _ in range(2):
+            await asyncio.sleep(0)
+
+        assert [json.loads(text)["speed"] for text in fast_ws.sent] == [100.0, 110.0]
+        assert not broadcast.done()
+
+        release.set()
+        await broadcast
+        assert slow_ws.send_text.await_count == 2
+        assert connection_manager.connection_count == 2
+
     async def test_connection_manager_thread_safety(self, connection_manager):
         """Test ConnectionManager thread safety"""
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
+        mock_ws1 = MockWebSocketFactory.create_stub()
+        mock_ws2 = MockWebSocketFactory.create_stub()
 
         # Test concurrent operations
         await asyncio.gather(connection_manager.connect(mock_ws1), connection_manager.connect(mock_ws2))
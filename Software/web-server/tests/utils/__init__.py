@@ -6,7 +6,7 @@ to reduce code duplication across test modules.
 """
 
 from .mock_factories import MockConfigManagerFactory, MockProcessManagerFactory
-from .test_helpers import ShotDataHelper, ConfigTestHelper, ProcessTestHelper
+from .test_helpers import ShotDataHelper, ConfigTestHelper, ProcessTestHelper, shot_simulator
 
 __all__ = [
     "MockConfigManagerFactory",
@@ -14,4 +14,5 @@ __all__ = [
     "ShotDataHelper",
     "ConfigTestHelper",
     "ProcessTestHelper",
+    "shot_simulator",
 ]
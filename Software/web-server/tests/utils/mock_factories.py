@@ -5,6 +5,8 @@ This module provides factory functions to create commonly used mock objects
 with realistic default values and behaviors.
 """
 
+import asyncio
+from typing import Any, List
 from unittest.mock import Mock, AsyncMock
 
 
@@ -160,6 +162,34 @@ class MockActiveMQFactory:
         return connection
 
 
+class WebSocketStub:
+    """Minimal WebSocket stand-in for tests that don't assert on call arguments.
+
+    Avoids AsyncMock's call recording; sent payloads are kept in ``sent`` and
+    ``receive_text`` behaves like an idle client by timing out.
+    """
+
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+        self.accepted = False
+        self.closed = False
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def send_json(self, data: Any) -> None:
+        self.sent.append(data)
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def receive_text(self) -> str:
+        raise asyncio.TimeoutError
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
 class MockWebSocketFactory:
     """Factory for creating WebSocket mocks."""
 
@@ -176,3 +206,8 @@ class MockWebSocketFactory:
         ws.close = AsyncMock()
 
         return ws
+
+    @staticmethod
+    def create_stub() -> WebSocketStub:
+        """Create a lightweight WebSocket stub without mock call recording."""
+        return WebSocketStub()
@@ -6,11 +6,19 @@ data generation, assertions, and test setup/teardown operations.
 """
 
 import random
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import tempfile
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SHOT_MESSAGES = ("Great shot!", "Nice swing!", "Perfect contact!", "Solid strike!")
+
 
 class ShotDataHelper:
     """Helper class for generating and validating shot data."""
@@ -25,16 +33,18 @@ class ShotDataHelper:
         sidespin_range=(-1000, 1000),
     ) -> Dict[str, Any]:
         """Generate realistic shot data with random values within specified ranges."""
+        uniform = random.uniform
+        randint = random.randint
         return {
-            "speed": round(random.uniform(*speed_range), 1),
-            "carry": round(random.uniform(*carry_range), 1),
-            "launch_angle": round(random.uniform(*launch_range), 1),
-            "side_angle": round(random.uniform(*side_range), 1),
-            "back_spin": random.randint(*backspin_range),
-            "side_spin": random.randint(*sidespin_range),
+            "speed": round(uniform(*speed_range), 1),
+            "carry": round(uniform(*carry_range), 1),
+            "launch_angle": round(uniform(*launch_range), 1),
+            "side_angle": round(uniform(*side_range), 1),
+            "back_spin": randint(*backspin_range),
+            "side_spin": randint(*sidespin_range),
             "result_type": 7,  # HIT
-            "message": random.choice(["Great shot!", "Nice swing!", "Perfect contact!", "Solid strike!"]),
-            "image_paths": [f"shot_{random.randint(1000, 9999)}.jpg"],
+            "message": random.choice(SHOT_MESSAGES),
+            "image_paths": [f"shot_{randint(1000, 9999)}.jpg"],
         }
 
     @staticmethod
@@ -83,13 +93,16 @@ class ShotDataHelper:
         return True
 
 
+shot_simulator = ShotDataHelper()
+
+
 class ConfigTestHelper:
     """Helper class for configuration-related test operations."""
 
     @staticmethod
-    def create_temp_config_dir() -> Path:
-        """Create a temporary directory with basic config structure."""
-        temp_dir = Path(tempfile.mkdtemp())
+    def create_temp_config_dir(base: Optional[Path] = None) -> Path:
+        """Create a directory with basic config structure, in a new temp dir unless base is given."""
+        temp_dir = base if base is not None else Path(tempfile.mkdtemp())
 
         (temp_dir / ".pitrac" / "config").mkdir(parents=True)
         (temp_dir / "LM_Shares" / "Images").mkdir(parents=True)
@@ -146,7 +159,11 @@ class ConfigTestHelper:
 
     @staticmethod
     def write_config_file(path: Path, config: Dict[str, Any]) -> None:
-        """Write configuration data to a JSON file."""
+        """Write configuration data to a JSON file, using orjson when it is installed."""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            return
+
         with open(path, "w") as f:
             json.dump(config, f, indent=2)
 
@@ -221,3 +238,51 @@ class APITestHelper:
         if expected_error:
             assert "message" in response_data, "Error response should have 'message' field"
             assert expected_error in response_data["message"], f"Expected error '{expected_error}' not found in message"
+
+
+class ServerStateHelper:
+    """Helper for snapshotting and restoring the shared test server"""
+
+    CONTAINER_TYPES = (dict, list, set, deque)
+
+    @staticmethod
+    def owners(server) -> Tuple[Any, ...]:
+        """Objects whose instance attributes tests rebind or mutate"""
+        owners = (
+            server,
+            server.config_manager,
+            server.pitrac_manager,
+            server.calibration_manager,
+            server.testing_manager,
+            server.shot_store,
+            server.connection_manager,
+        )
+        return owners + ((server.listener,) if server.listener is not None else ())
+
+    @staticmethod
+    def snapshot(server) -> List[Tuple[Any, Dict[str, Any], Dict[str, Any]]]:
+        """Record each owner's attributes, plus a copy of the contents of any container attribute"""
+        snapshot = []
+        for owner in ServerStateHelper.owners(server):
+            attributes = dict(vars(owner))
+            contents = {
+                name: value.copy()
+                for name, value in attributes.items()
+                if isinstance(value, ServerStateHelper.CONTAINER_TYPES)
+            }
+            snapshot.append((owner, attributes, contents))
+        return snapshot
+
+    @staticmethod
+    def restore(snapshot: List[Tuple[Any, Dict[str, Any], Dict[str, Any]]]) -> None:
+        """Rebind the recorded attributes and put container contents back in place"""
+        for owner, attributes, contents in snapshot:
+            vars(owner).clear()
+            vars(owner).update(attributes)
+            for name, saved in contents.items():
+                container = attributes[name]
+                container.clear()
+                if isinstance(container, (dict, set)):
+                    container.update(saved)
+                else:
+                    container.extend(saved)